@@ -13,21 +13,22 @@ Usage examples:
   python cli.py resolve --event-id MRNA_2026-04-15_abcd1234 \\
                          --outcome positive
 
-  python cli.py list   --upcoming --type fda_pdufa
+  python cli.py list   --upcoming --type fda_pdufa --limit 20
   python cli.py report
   python cli.py export --output export.json
+  python cli.py export --format msgpack
 """
 import argparse
 import json
 import logging
 import sys
 from datetime import date, datetime
+from itertools import chain
 from pathlib import Path
+from types import SimpleNamespace
+from typing import List, Optional
 
 from models.event import EventType, EventOutcome, SentimentTag
-from collectors.catalyst_tracker import create_event, resolve_event, filter_upcoming_events
-from engine.scorer import score_event
-from engine.comparator import batch_compare, compute_stats, print_comparison_table
 from storage.event_store import EventStore
 
 logging.basicConfig(
@@ -36,6 +37,17 @@ logging.basicConfig(
 )
 logger = logging.getLogger("cli")
 
+DEFAULT_EXPORT_STEM = "biotech_export"
+EXPORT_FORMATS      = ("json", "msgpack")
+
+# Stand-in for events without a rating in `list` output
+_NO_RATING = SimpleNamespace(grade=SimpleNamespace(value="--"), composite_score=None)
+
+# argparse choices, computed once at import
+_EVENT_TYPE_CHOICES = tuple(e.value for e in EventType)
+_SENTIMENT_CHOICES  = tuple(s.value for s in SentimentTag)
+_OUTCOME_CHOICES    = tuple(o.value for o in EventOutcome if o != EventOutcome.PENDING)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -48,6 +60,16 @@ def _parse_date(s: str) -> date:
         raise argparse.ArgumentTypeError(f"Invalid date format '{s}'; expected YYYY-MM-DD")
 
 
+def _positive_int(s: str) -> int:
+    try:
+        n = int(s)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid integer '{s}'")
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"Expected a positive integer, got {n}")
+    return n
+
+
 def _print_event_summary(event, rating=None):
     print(f"\n{'='*60}")
     print(f"  {event.ticker} | {event.company_name}")
@@ -75,6 +97,8 @@ def _print_event_summary(event, rating=None):
 
 def cmd_add(args, store: EventStore):
     """Add a new biotech catalyst event."""
+    from collectors.catalyst_tracker import create_event
+
     competing = args.competing.split(",") if args.competing else []
     event = create_event(
         ticker            = args.ticker,
@@ -98,6 +122,8 @@ def cmd_add(args, store: EventStore):
 
 def cmd_score(args, store: EventStore):
     """Score an event and save the rating."""
+    from engine.scorer import score_event
+
     event = store.get_event(args.event_id)
     if event is None:
         print(f"[!] Event not found: {args.event_id}", file=sys.stderr)
@@ -118,6 +144,8 @@ def cmd_score(args, store: EventStore):
 
 def cmd_resolve(args, store: EventStore):
     """Mark an event as resolved with outcome."""
+    from collectors.catalyst_tracker import resolve_event
+
     event = store.get_event(args.event_id)
     if event is None:
         print(f"[!] Event not found: {args.event_id}", file=sys.stderr)
@@ -141,45 +169,61 @@ def cmd_resolve(args, store: EventStore):
 
 def cmd_list(args, store: EventStore):
     """List events, optionally filtered."""
+    from collectors.catalyst_tracker import filter_upcoming_events
+
     events = store.load_events()
     ratings = store.ratings_by_event()
 
+    # Ticker is the most selective filter, so apply it first to shrink the
+    # list the type/upcoming filters have to walk.
+    if args.ticker:
+        ticker = args.ticker.upper()
+        events = [e for e in events if e.ticker.upper() == ticker]
     if args.upcoming:
         event_types = [EventType(t) for t in args.type.split(",")] if args.type else None
-        events = filter_upcoming_events(events, event_types=event_types)
-    elif args.type:
-        events = [e for e in events if e.event_type.value == args.type]
-    if args.ticker:
-        events = [e for e in events if e.ticker.upper() == args.ticker.upper()]
+        events = filter_upcoming_events(events, event_types=event_types, limit=args.limit)
+    else:
+        if args.type:
+            type_value = args.type
+            events = [e for e in events if e.event_type.value == type_value]
+        if args.limit:
+            events = events[:args.limit]
 
     if not events:
         print("No events found.")
         return
 
-    for ev in events:
-        rating = ratings.get(ev.event_id or "")
-        grade  = rating.grade.value if rating else "--"
-        score  = f"{rating.composite_score:.1f}" if rating else "--"
-        print(
-            f"{ev.ticker:<8} {ev.event_date}  "
-            f"{ev.event_type.value:<22} "
-            f"{ev.outcome.value:<12} "
-            f"Grade: {grade:<4} Score: {score}"
-        )
+    # One formatted line per event, written with a single call
+    rows = ((ev, ratings.get(ev.event_id or "", _NO_RATING)) for ev in events)
+    lines = [
+        f"{ev.ticker:<8} {ev.event_date}  "
+        f"{ev.event_type.value:<22} "
+        f"{ev.outcome.value:<12} "
+        f"Grade: {r.grade.value:<4} Score: "
+        f"{'--' if r.composite_score is None else f'{r.composite_score:.1f}'}"
+        for ev, r in rows
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_report(args, store: EventStore):
     """Print performance report of resolved events."""
+    from engine.comparator import StatsAccumulator, iter_comparisons, print_comparison_table
+
     events  = store.load_events()
     ratings = store.ratings_by_event()
-    comparisons = batch_compare(events, ratings)
 
-    if not comparisons:
+    # Stream comparisons: each row is printed and folded into the stats as
+    # it is built, so no comparison list is ever materialised.
+    comparisons = iter_comparisons(events, ratings)
+    first = next(comparisons, None)
+    if first is None:
         print("No resolved events with price data to report.")
         return
 
-    print_comparison_table(comparisons)
-    stats = compute_stats(comparisons, events)
+    acc = StatsAccumulator()
+    print_comparison_table(acc.track(chain([first], comparisons)))
+    stats = acc.result(events)
     print("\nAggregate Stats:")
     for k, v in stats.to_dict().items():
         val = f"{v:.2f}" if isinstance(v, float) else str(v)
@@ -187,9 +231,16 @@ def cmd_report(args, store: EventStore):
 
 
 def cmd_export(args, store: EventStore):
-    """Export all data to a JSON file."""
-    out = Path(args.output)
-    store.export_json(out)
+    """Export all data to a JSON or MessagePack file."""
+    out = Path(args.output or f"{DEFAULT_EXPORT_STEM}.{args.format}")
+    try:
+        if args.format == "msgpack":
+            store.export_msgpack(out)
+        else:
+            store.export_json(out)
+    except ImportError as exc:
+        print(f"[!] {exc}", file=sys.stderr)
+        sys.exit(1)
     print(f"[+] Exported to {out}")
 
 
@@ -197,88 +248,192 @@ def cmd_export(args, store: EventStore):
 # Argument parser
 # ---------------------------------------------------------------------------
 
-def build_parser() -> argparse.ArgumentParser:
+# Each builder only adds the options for its own subcommand; build_parser()
+# registers just the one that was invoked so the others cost nothing.
+
+def _build_add(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--ticker",      required=True)
+    p.add_argument("--company",     required=True)
+    p.add_argument("--type",        required=True,
+                   choices=_EVENT_TYPE_CHOICES)
+    p.add_argument("--date",        required=True, help="YYYY-MM-DD")
+    p.add_argument("--desc",        required=True)
+    p.add_argument("--sentiment",   default="neutral",
+                   choices=_SENTIMENT_CHOICES)
+    p.add_argument("--stage",       default=None)
+    p.add_argument("--indication",  default=None)
+    p.add_argument("--endpoint",    default=None)
+    p.add_argument("--competing",   default=None, help="Comma-separated drug names")
+    p.add_argument("--notes",       default=None)
+    p.add_argument("--tags",        default=None, help="Comma-separated tags")
+    p.add_argument("--no-market",   action="store_true",
+                   help="Skip auto market context fetch")
+
+
+def _build_score(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--event-id",  required=True)
+    p.add_argument("--iv-rank",   type=float, default=None,
+                   help="Current IV Rank 0-100")
+
+
+def _build_resolve(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--event-id",  required=True)
+    p.add_argument("--outcome",   required=True,
+                   choices=_OUTCOME_CHOICES)
+    p.add_argument("--notes",     default=None)
+    p.add_argument("--move",      type=float, default=None,
+                   help="Override actual move pct")
+    p.add_argument("--iv-crush",  type=float, default=None)
+    p.add_argument("--no-fetch",  action="store_true",
+                   help="Skip auto price fetch")
+
+
+def _build_list(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--upcoming",  action="store_true")
+    p.add_argument("--type",      default=None)
+    p.add_argument("--ticker",    default=None)
+    p.add_argument("--limit",     type=_positive_int, default=None,
+                   help="Show at most N events (earliest first with --upcoming)")
+
+
+def _build_report(p: argparse.ArgumentParser) -> None:
+    pass
+
+
+def _build_export(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--output", default=None,
+                   help=f"Defaults to {DEFAULT_EXPORT_STEM}.<format>")
+    p.add_argument("--format", default="json", choices=EXPORT_FORMATS)
+
+
+# name -> (help text, argument builder)
+SUBCOMMANDS = {
+    "add":     ("Add a new catalyst event", _build_add),
+    "score":   ("Score an event and generate options rating", _build_score),
+    "resolve": ("Mark an event as resolved", _build_resolve),
+    "list":    ("List events", _build_list),
+    "report":  ("Print post-event performance report", _build_report),
+    "export":  ("Export all data to JSON or MessagePack", _build_export),
+}
+
+
+def build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser.  When `command` names a known subcommand only that
+    subparser is fully built; otherwise (top-level --help, typos) every
+    subcommand is registered as an argument-less stub so the listing and
+    "invalid choice" errors still work.
+    """
     parser = argparse.ArgumentParser(
         prog="biotech-rater",
         description="Biotech catalyst tracker and options trade rater.",
     )
     sub = parser.add_subparsers(dest="command", required=True)
 
-    # --- add ---
-    p_add = sub.add_parser("add", help="Add a new catalyst event")
-    p_add.add_argument("--ticker",      required=True)
-    p_add.add_argument("--company",     required=True)
-    p_add.add_argument("--type",        required=True,
-                       choices=[e.value for e in EventType])
-    p_add.add_argument("--date",        required=True, help="YYYY-MM-DD")
-    p_add.add_argument("--desc",        required=True)
-    p_add.add_argument("--sentiment",   default="neutral",
-                       choices=[s.value for s in SentimentTag])
-    p_add.add_argument("--stage",       default=None)
-    p_add.add_argument("--indication",  default=None)
-    p_add.add_argument("--endpoint",    default=None)
-    p_add.add_argument("--competing",   default=None, help="Comma-separated drug names")
-    p_add.add_argument("--notes",       default=None)
-    p_add.add_argument("--tags",        default=None, help="Comma-separated tags")
-    p_add.add_argument("--no-market",   action="store_true",
-                       help="Skip auto market context fetch")
-
-    # --- score ---
-    p_score = sub.add_parser("score", help="Score an event and generate options rating")
-    p_score.add_argument("--event-id",  required=True)
-    p_score.add_argument("--iv-rank",   type=float, default=None,
-                         help="Current IV Rank 0-100")
-
-    # --- resolve ---
-    p_res = sub.add_parser("resolve", help="Mark an event as resolved")
-    p_res.add_argument("--event-id",  required=True)
-    p_res.add_argument("--outcome",   required=True,
-                       choices=[o.value for o in EventOutcome if o != EventOutcome.PENDING])
-    p_res.add_argument("--notes",     default=None)
-    p_res.add_argument("--move",      type=float, default=None,
-                       help="Override actual move pct")
-    p_res.add_argument("--iv-crush",  type=float, default=None)
-    p_res.add_argument("--no-fetch",  action="store_true",
-                       help="Skip auto price fetch")
-
-    # --- list ---
-    p_list = sub.add_parser("list", help="List events")
-    p_list.add_argument("--upcoming",  action="store_true")
-    p_list.add_argument("--type",      default=None)
-    p_list.add_argument("--ticker",    default=None)
-
-    # --- report ---
-    sub.add_parser("report", help="Print post-event performance report")
-
-    # --- export ---
-    p_exp = sub.add_parser("export", help="Export all data to JSON")
-    p_exp.add_argument("--output", default="biotech_export.json")
+    if command in SUBCOMMANDS:
+        help_text, build = SUBCOMMANDS[command]
+        build(sub.add_parser(command, help=help_text))
+    else:
+        for name, (help_text, _) in SUBCOMMANDS.items():
+            sub.add_parser(name, help=help_text)
 
     return parser
 
 
+# ---------------------------------------------------------------------------
+# Fast path for read-only commands
+# ---------------------------------------------------------------------------
+# list/report/export are the commands scripts call repeatedly and take only a
+# handful of flags, so they skip argparse entirely.  Each flag maps to
+# (dest, converter); a converter of None marks a store_true flag.
+
+def _choice(allowed):
+    """Converter that rejects values outside `allowed` (mirrors choices=)."""
+    def convert(value: str) -> str:
+        if value not in allowed:
+            raise ValueError(value)
+        return value
+    return convert
+
+
+_FAST_COMMANDS = {
+    "list": {
+        "--upcoming": ("upcoming", None),
+        "--type":     ("type",     str),
+        "--ticker":   ("ticker",   str),
+        "--limit":    ("limit",    _positive_int),
+    },
+    "report": {},
+    "export": {
+        "--output":   ("output",   str),
+        "--format":   ("format",   _choice(EXPORT_FORMATS)),
+    },
+}
+
+_FAST_DEFAULTS = {
+    "list":   {"upcoming": False, "type": None, "ticker": None, "limit": None},
+    "report": {},
+    "export": {"output": None, "format": "json"},
+}
+
+
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse `argv` (without the program name) for a fast-path command.
+    Returns None whenever argparse should handle it instead: other commands,
+    -h/--help, unknown flags or a missing/invalid value.
+    """
+    if not argv or argv[0] not in _FAST_COMMANDS:
+        return None
+    command = argv[0]
+    spec = _FAST_COMMANDS[command]
+    args = SimpleNamespace(command=command, **_FAST_DEFAULTS[command])
+
+    tokens = iter(argv[1:])
+    for tok in tokens:
+        opt = spec.get(tok)
+        if opt is None:
+            return None
+        dest, convert = opt
+        if convert is None:
+            setattr(args, dest, True)
+            continue
+        value = next(tokens, None)
+        if value is None or value.startswith("--"):
+            return None
+        try:
+            setattr(args, dest, convert(value))
+        except (ValueError, argparse.ArgumentTypeError):
+            return None
+    return args
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
 
+_DISPATCH = {
+    "add":     cmd_add,
+    "score":   cmd_score,
+    "resolve": cmd_resolve,
+    "list":    cmd_list,
+    "report":  cmd_report,
+    "export":  cmd_export,
+}
+
+
 def main():
-    parser = build_parser()
-    args   = parser.parse_args()
-    store  = EventStore()
-
-    dispatch = {
-        "add":     cmd_add,
-        "score":   cmd_score,
-        "resolve": cmd_resolve,
-        "list":    cmd_list,
-        "report":  cmd_report,
-        "export":  cmd_export,
-    }
-    handler = dispatch.get(args.command)
+    args = _fast_parse(sys.argv[1:])
+    if args is None:
+        command = sys.argv[1] if len(sys.argv) > 1 else None
+        args    = build_parser(command).parse_args()
+    store = EventStore()
+
+    handler = _DISPATCH.get(args.command)
     if handler:
         handler(args, store)
     else:
-        parser.print_help()
+        build_parser().print_help()
 
 
 if __name__ == "__main__":
@@ -2,13 +2,17 @@
 Tracks biotech catalysts: adds, updates, and resolves BiotechEvents.
 Acts as an in-session manager that wraps the persistent EventStore.
 """
+import heapq
 import uuid
 import logging
 from datetime import date
-from typing import List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
 
 from models.event import BiotechEvent, EventType, EventOutcome, SentimentTag, MarketContext
-from collectors.market_data import build_market_context, fetch_post_event_moves
+
+if TYPE_CHECKING:
+    import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +48,71 @@ PIPELINE_STAGE_WEIGHT: dict = {
     "Marketed":     1.00,
     "Preclinical":  0.30,
 }
+UNKNOWN_STAGE_WEIGHT = 0.70
+
+# create_event only auto-fetches market context for events at most this many
+# calendar days (~5 trading days) ahead.
+MARKET_CONTEXT_HORIZON_DAYS = 7
+
+# ---------------------------------------------------------------------------
+# Ordinal encodings for batch scoring
+# Batch paths encode event types / pipeline stages as small integer codes
+# once, then gather weights from flat arrays instead of hashing enum keys
+# per event.  Unrecognised stages get UNKNOWN_STAGE_CODE and events with
+# no stage at all get NO_STAGE_CODE (multiplier 1.0).
+# NumPy is imported inside the batch helpers so that list/filter callers of
+# this module do not pay for it.
+# ---------------------------------------------------------------------------
+EVENT_TYPE_CODE: Dict[EventType, int] = {et: i for i, et in enumerate(EventType)}
+PIPELINE_STAGE_CODE: Dict[str, int] = {s: i for i, s in enumerate(PIPELINE_STAGE_WEIGHT)}
+UNKNOWN_STAGE_CODE = len(PIPELINE_STAGE_CODE)
+NO_STAGE_CODE      = UNKNOWN_STAGE_CODE + 1
+SENTIMENT_CODE: Dict[SentimentTag, int] = {s: i for i, s in enumerate(SentimentTag)}
+
+_PRIORITY_BY_TYPE_CODE = tuple(CATALYST_PRIORITY.get(et, 25) for et in EventType)
+_WEIGHT_BY_STAGE_CODE  = tuple(PIPELINE_STAGE_WEIGHT.values()) + (UNKNOWN_STAGE_WEIGHT, 1.0)
+
+
+def event_type_codes(events: Sequence[BiotechEvent]) -> "np.ndarray":
+    """Ordinal EventType code per event (see EVENT_TYPE_CODE)."""
+    import numpy as np
+    return np.fromiter(
+        (EVENT_TYPE_CODE[e.event_type] for e in events), dtype=np.intp, count=len(events)
+    )
+
+
+def pipeline_stage_codes(events: Sequence[BiotechEvent]) -> "np.ndarray":
+    """Ordinal pipeline-stage code per event (see PIPELINE_STAGE_CODE)."""
+    import numpy as np
+    return np.fromiter(
+        (_stage_code(e.pipeline_stage) for e in events), dtype=np.intp, count=len(events),
+    )
+
+
+def sentiment_codes(events: Sequence[BiotechEvent]) -> "np.ndarray":
+    """Ordinal SentimentTag code per event (see SENTIMENT_CODE)."""
+    import numpy as np
+    return np.fromiter(
+        (SENTIMENT_CODE[e.sentiment] for e in events), dtype=np.intp, count=len(events)
+    )
+
+
+def _stage_code(stage: Optional[str]) -> int:
+    if not stage:
+        return NO_STAGE_CODE
+    return PIPELINE_STAGE_CODE.get(stage, UNKNOWN_STAGE_CODE)
+
+
+def catalyst_priority_batch(type_codes: "np.ndarray") -> "np.ndarray":
+    """CATALYST_PRIORITY for an array of event-type codes."""
+    import numpy as np
+    return np.asarray(_PRIORITY_BY_TYPE_CODE, dtype=np.int16)[type_codes]
+
+
+def stage_weight_batch(stage_codes: "np.ndarray") -> "np.ndarray":
+    """PIPELINE_STAGE_WEIGHT for an array of stage codes."""
+    import numpy as np
+    return np.asarray(_WEIGHT_BY_STAGE_CODE, dtype=np.float64)[stage_codes]
 
 
 def create_event(
@@ -67,7 +136,17 @@ def create_event(
     """
     event_id = f"{ticker.upper()}_{event_date.isoformat()}_{str(uuid.uuid4())[:8]}"
     market_ctx = None
-    if auto_market_context:
+    if auto_market_context and (event_date - date.today()).days > MARKET_CONTEXT_HORIZON_DAYS:
+        # Far-future dates would only get today's bars back; leave the
+        # context empty so it can be backfilled closer to the event.
+        logger.info(
+            "Skipping market context for %s: %s is more than %d days out",
+            ticker, event_date, MARKET_CONTEXT_HORIZON_DAYS,
+        )
+    elif auto_market_context:
+        # Deferred: market_data pulls in yfinance/pandas, which callers that
+        # only filter or score events (e.g. `cli.py list`) should not pay for.
+        from collectors.market_data import build_market_context
         try:
             market_ctx = build_market_context(event_date)
             logger.info("Market context built for %s on %s", ticker, event_date)
@@ -108,6 +187,7 @@ def resolve_event(
     event.outcome_notes = outcome_notes
 
     if auto_fetch_moves:
+        from collectors.market_data import fetch_post_event_moves
         try:
             t_move, spy_move, xbi_move = fetch_post_event_moves(
                 event.ticker, event.event_date
@@ -136,22 +216,40 @@ def catalyst_quality_score(event: BiotechEvent) -> float:
     This is the primary input for the scoring engine's
     `catalyst_quality` dimension.
     """
+    return _catalyst_quality(
+        event.event_type,
+        event.pipeline_stage,
+        len(event.primary_endpoint or "") > 10,
+        event.sentiment,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _catalyst_quality(
+    event_type: EventType,
+    pipeline_stage: Optional[str],
+    well_defined_endpoint: bool,
+    sentiment: SentimentTag,
+) -> float:
+    # Pure function of the few event fields it reads, so results are
+    # memoised across events sharing the same inputs.
+
     # Base from event type priority
-    base = CATALYST_PRIORITY.get(event.event_type, 25)
+    base = CATALYST_PRIORITY.get(event_type, 25)
 
     # Pipeline stage multiplier (biotech-specific events only)
     stage_mult = 1.0
-    if event.pipeline_stage and event.event_type in (
+    if pipeline_stage and event_type in (
         EventType.FDA_PDUFA,
         EventType.FDA_ADCOM,
         EventType.CLINICAL_READOUT,
     ):
-        stage_mult = PIPELINE_STAGE_WEIGHT.get(event.pipeline_stage, 0.70)
+        stage_mult = PIPELINE_STAGE_WEIGHT.get(pipeline_stage, UNKNOWN_STAGE_WEIGHT)
 
     raw = base * stage_mult
 
     # Bonus: well-defined primary endpoint
-    if event.primary_endpoint and len(event.primary_endpoint) > 10:
+    if well_defined_endpoint:
         raw = min(raw + 5, 100)
 
     # Sentiment adjustment
@@ -162,9 +260,48 @@ def catalyst_quality_score(event: BiotechEvent) -> float:
         SentimentTag.SELL:        -4,
         SentimentTag.STRONG_SELL: -8,
     }
-    raw += sentiment_adj.get(event.sentiment, 0)
+    raw += sentiment_adj.get(sentiment, 0)
 
-    return round(min(max(raw, 0), 100), 2)
+    return round(min(max(raw, 0.0), 100.0), 2)
+
+
+def catalyst_quality_batch(events: Sequence[BiotechEvent]) -> "np.ndarray":
+    """
+    catalyst_quality_score for many events at once.
+
+    The score only depends on (event type, stage, endpoint bonus,
+    sentiment), a domain of ~1.3k combinations, so the scalar function is
+    tabulated once and the batch becomes a single gather from that table.
+    Values are identical to the scalar path.
+    """
+    import numpy as np
+    if not events:
+        return np.empty(0, dtype=np.float64)
+    endpoint = np.fromiter(
+        (len(e.primary_endpoint or "") > 10 for e in events), dtype=np.intp, count=len(events)
+    )
+    return _catalyst_quality_table()[
+        event_type_codes(events), pipeline_stage_codes(events), endpoint, sentiment_codes(events)
+    ]
+
+
+@lru_cache(maxsize=None)
+def _catalyst_quality_table() -> "np.ndarray":
+    """(type, stage, endpoint bonus, sentiment) -> score, from the scalar scorer."""
+    import numpy as np
+    # Stage axis follows the stage codes: known stages, then an unrecognised
+    # stage, then no stage.
+    stages = list(PIPELINE_STAGE_CODE) + ["<unknown>", None]
+    table = np.empty(
+        (len(EVENT_TYPE_CODE), len(stages), 2, len(SENTIMENT_CODE)), dtype=np.float64
+    )
+    for et, i in EVENT_TYPE_CODE.items():
+        for j, stage in enumerate(stages):
+            for k in (0, 1):
+                for sent, m in SENTIMENT_CODE.items():
+                    table[i, j, k, m] = _catalyst_quality(et, stage, bool(k), sent)
+    table.setflags(write=False)
+    return table
 
 
 def competitive_moat_score(event: BiotechEvent) -> float:
@@ -172,7 +309,11 @@ def competitive_moat_score(event: BiotechEvent) -> float:
     Estimate competitive moat / pipeline differentiation (0-100).
     Fewer competitors = higher score.
     """
-    n_competitors = len(event.competing_drugs)
+    return _competitive_moat(len(event.competing_drugs))
+
+
+@lru_cache(maxsize=None)
+def _competitive_moat(n_competitors: int) -> float:
     if n_competitors == 0:
         return 85.0
     elif n_competitors == 1:
@@ -188,10 +329,12 @@ def filter_upcoming_events(
     events: List[BiotechEvent],
     as_of: Optional[date] = None,
     event_types: Optional[List[EventType]] = None,
+    limit: Optional[int] = None,
 ) -> List[BiotechEvent]:
     """
     Filter events that are upcoming (pending) as of `as_of` date.
-    Optionally filter by event type.
+    Optionally filter by event type.  With `limit`, only the `limit`
+    soonest events are returned (partial heap selection, not a full sort).
     """
     as_of = as_of or date.today()
     results = [
@@ -199,5 +342,8 @@ def filter_upcoming_events(
         if e.outcome == EventOutcome.PENDING and e.event_date >= as_of
     ]
     if event_types:
-        results = [e for e in results if e.event_type in event_types]
+        wanted = frozenset(event_types)
+        results = [e for e in results if e.event_type in wanted]
+    if limit is not None:
+        return heapq.nsmallest(limit, results, key=lambda e: e.event_date)
     return sorted(results, key=lambda e: e.event_date)
@@ -3,8 +3,13 @@ Fetches market benchmarks (SPY, XBI, VIX) and macro release data
 using yfinance and a lightweight FRED-style approach.
 """
 import logging
+import os
+import shelve
 from datetime import date, timedelta
-from typing import Optional, Dict, Tuple
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 try:
     import yfinance as yf
@@ -14,6 +19,9 @@ except ImportError:
 
 from models.event import MarketContext
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 # Qualitative macro release calendar (static baseline; update as needed)
@@ -45,31 +53,103 @@ def _assert_yfinance():
         )
 
 
-def fetch_price_return(
-    ticker: str,
+# ---------------------------------------------------------------------------
+# Price cache
+# ---------------------------------------------------------------------------
+# Derived values (period returns, VIX closes) are cached per
+# "TICKER:YYYY-MM-DD:lookback" key, in-process and in a shelve file, so
+# re-running a command over the same dates never hits the network twice.
+# Dates within CACHE_FRESH_DAYS of today are never cached: their bars may
+# still be intraday or revised.
+
+PRICE_CACHE_PATH = Path(
+    os.environ.get("BIOTECH_CACHE_DIR", Path.home() / ".cache" / "biotech-rater")
+) / "prices.db"
+CACHE_FRESH_DAYS = 3
+
+_memory_cache: Dict[str, float] = {}
+
+
+def _cache_key(ticker: str, end_date: date, lookback: object) -> str:
+    return f"{ticker}:{end_date.isoformat()}:{lookback}"
+
+
+def _is_cacheable(end_date: date) -> bool:
+    return (date.today() - end_date).days > CACHE_FRESH_DAYS
+
+
+def _cache_get(keys: Sequence[str]) -> Dict[str, float]:
+    """Return the cached values for whichever of `keys` are present."""
+    hits = {k: _memory_cache[k] for k in keys if k in _memory_cache}
+    missing = [k for k in keys if k not in hits]
+    if not missing:
+        return hits
+    try:
+        with shelve.open(str(PRICE_CACHE_PATH), flag="r") as db:
+            found = {k: db[k] for k in missing if k in db}
+    except Exception:
+        return hits  # no cache file yet, or unreadable
+    _memory_cache.update(found)
+    hits.update(found)
+    return hits
+
+
+def _cache_put(values: Dict[str, float]) -> None:
+    _memory_cache.update(values)
+    try:
+        PRICE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with shelve.open(str(PRICE_CACHE_PATH)) as db:
+            db.update(values)
+    except Exception as exc:
+        logger.warning("Could not write price cache %s: %s", PRICE_CACHE_PATH, exc)
+
+
+def _download_grouped(
+    tickers: Sequence[str],
+    start: date,
     end_date: date,
-    lookback_days: int = 5,
-) -> Optional[float]:
+) -> Dict[str, "pd.DataFrame"]:
     """
-    Fetch the cumulative percentage return for `ticker` over the
-    `lookback_days` trading days ending on `end_date`.
-
-    Returns None if data is unavailable.
+    Fetch several tickers in a single yfinance round-trip and split the
+    grouped result into one OHLC frame per ticker.  Tickers with no data
+    are left out of the returned dict.
     """
     _assert_yfinance()
-    start = end_date - timedelta(days=lookback_days * 2)  # buffer for holidays
     try:
         df = yf.download(
-            ticker,
+            list(tickers),
             start=start.isoformat(),
             end=(end_date + timedelta(days=1)).isoformat(),
+            group_by="ticker",
+            threads=True,
             auto_adjust=True,
             progress=False,
         )
-        if df.empty or len(df) < 2:
+    except Exception as exc:
+        logger.error("Error fetching %s: %s", ", ".join(tickers), exc)
+        return {}
+    if df.empty:
+        return {}
+    if df.columns.nlevels == 1:
+        # yfinance < 0.2.48 returns flat OHLC columns for a single ticker
+        # even with group_by="ticker"
+        return {tickers[0]: df} if len(tickers) == 1 else {}
+    present = set(df.columns.get_level_values(0))
+    return {t: df[t] for t in tickers if t in present}
+
+
+def _period_return(
+    df: Optional["pd.DataFrame"],
+    ticker: str,
+    end_date: date,
+    lookback_days: int,
+) -> Optional[float]:
+    """Cumulative % return over the last `lookback_days` closes in `df`."""
+    try:
+        close = df["Close"].dropna() if df is not None and not df.empty else ()
+        if len(close) < 2:
             logger.warning("No price data for %s on %s", ticker, end_date)
             return None
-        close = df["Close"].dropna()
         recent = close.iloc[-lookback_days:] if len(close) >= lookback_days else close
         ret = (recent.iloc[-1] / recent.iloc[0] - 1) * 100
         return round(float(ret), 4)
@@ -78,25 +158,119 @@ def fetch_price_return(
         return None
 
 
-def fetch_vix_level(event_date: date) -> Optional[float]:
-    """Return the closing VIX level on or nearest to event_date."""
-    _assert_yfinance()
+def _last_close(df: Optional["pd.DataFrame"]) -> Optional[float]:
+    """Most recent closing level in `df`, rounded to 2dp."""
     try:
-        df = yf.download(
-            "^VIX",
-            start=(event_date - timedelta(days=5)).isoformat(),
-            end=(event_date + timedelta(days=1)).isoformat(),
-            auto_adjust=True,
-            progress=False,
-        )
-        if df.empty:
+        if df is None or df.empty:
+            return None
+        close = df["Close"].dropna()
+        if close.empty:
             return None
-        return round(float(df["Close"].dropna().iloc[-1]), 2)
+        return round(float(close.iloc[-1]), 2)
     except Exception as exc:
         logger.error("VIX fetch error: %s", exc)
         return None
 
 
+def _fetch_values(
+    wanted: Dict[str, Tuple[str, Callable[[Optional["pd.DataFrame"]], Optional[float]]]],
+    start: date,
+    end_date: date,
+) -> Dict[str, Optional[float]]:
+    """
+    Resolve one value per ticker.  `wanted` maps ticker -> (cache key,
+    function computing the value from that ticker's OHLC frame).  Cache hits
+    are served directly; all misses share a single grouped download.
+    """
+    use_cache = _is_cacheable(end_date)
+    cached = _cache_get([key for key, _ in wanted.values()]) if use_cache else {}
+    values: Dict[str, Optional[float]] = {t: cached.get(key) for t, (key, _) in wanted.items()}
+
+    missing = [t for t, v in values.items() if v is None]
+    if missing:
+        frames = _download_grouped(missing, start, end_date)
+        fresh = {}
+        for t in missing:
+            key, compute = wanted[t]
+            values[t] = compute(frames.get(t))
+            if values[t] is not None:
+                fresh[key] = values[t]
+        if use_cache and fresh:
+            _cache_put(fresh)
+    return values
+
+
+def fetch_price_return(
+    ticker: str,
+    end_date: date,
+    lookback_days: int = 5,
+    prices: Optional["pd.DataFrame"] = None,
+) -> Optional[float]:
+    """
+    Fetch the cumulative percentage return for `ticker` over the
+    `lookback_days` trading days ending on `end_date`.
+
+    `prices` may be a pre-fetched OHLC frame for `ticker` (e.g. one entry
+    of a batched download) in which case no network call is made.
+
+    Returns None if data is unavailable.
+    """
+    if prices is not None:
+        return _period_return(prices, ticker, end_date, lookback_days)
+    start = end_date - timedelta(days=lookback_days * 2)  # buffer for holidays
+    return _fetch_values(
+        {ticker: (
+            _cache_key(ticker, end_date, lookback_days),
+            lambda df: _period_return(df, ticker, end_date, lookback_days),
+        )},
+        start, end_date,
+    )[ticker]
+
+
+def fetch_price_returns_many(
+    pairs: Sequence[Tuple[str, date]],
+    lookback_days: int = 5,
+) -> Dict[Tuple[str, date], Optional[float]]:
+    """
+    fetch_price_return for many (ticker, end_date) pairs.  Pairs are grouped
+    by end_date and each date's cache misses share one grouped download
+    (yf.download keeps module-global state, so calls are not run from
+    threads).  Returns {(ticker, end_date): return_pct}.
+    """
+    by_date: Dict[date, List[str]] = {}
+    for ticker, end_date in dict.fromkeys(pairs):
+        by_date.setdefault(end_date, []).append(ticker)
+
+    results: Dict[Tuple[str, date], Optional[float]] = {}
+    for end_date, tickers in by_date.items():
+        start = end_date - timedelta(days=lookback_days * 2)  # buffer for holidays
+        values = _fetch_values(
+            {t: (
+                _cache_key(t, end_date, lookback_days),
+                lambda df, t=t: _period_return(df, t, end_date, lookback_days),
+            ) for t in tickers},
+            start, end_date,
+        )
+        results.update(((t, end_date), v) for t, v in values.items())
+    return results
+
+
+def fetch_vix_level(
+    event_date: date,
+    prices: Optional["pd.DataFrame"] = None,
+) -> Optional[float]:
+    """
+    Return the closing VIX level on or nearest to event_date.
+    `prices` may be a pre-fetched ^VIX frame to skip the download.
+    """
+    if prices is not None:
+        return _last_close(prices)
+    return _fetch_values(
+        {"^VIX": (_cache_key("^VIX", event_date, "close"), _last_close)},
+        event_date - timedelta(days=5), event_date,
+    )["^VIX"]
+
+
 def classify_sector_trend(
     spy_return: Optional[float],
     xbi_return: Optional[float],
@@ -132,19 +306,133 @@ def classify_sector_trend(
     return "neutral"
 
 
+_BATCH_TREND_LABELS = (
+    "strong_risk_on", "risk_on", "strong_risk_off", "risk_off",
+)
+
+
+def classify_sector_trend_batch(
+    spy_return: np.ndarray,
+    xbi_return: np.ndarray,
+    vix: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorised classify_sector_trend over parallel float arrays, with NaN
+    standing in for None.  Row i gets the same label the scalar function
+    returns for (spy_return[i], xbi_return[i], vix[i]).
+    """
+    spy = np.asarray(spy_return, dtype=np.float64)
+    xbi = np.asarray(xbi_return, dtype=np.float64)
+    vix = np.asarray(vix, dtype=np.float64)
+
+    # NaN compares False everywhere, so a missing XBI/VIX contributes 0
+    score = (
+        (spy > 0).astype(np.int8) + (spy > 1.5) - (spy < 0) - (spy < -1.5)
+        + (xbi > 2) - (xbi < -2)
+        + (vix < 15) - (vix > 25)
+    )
+    labels = np.select(
+        [score >= 3, score >= 1, score <= -3, score <= -1],
+        _BATCH_TREND_LABELS,
+        default="neutral",
+    )
+    return np.where(np.isnan(spy), "neutral", labels)
+
+
 def build_market_context(
     event_date: date,
     lookback_days: int = 5,
 ) -> MarketContext:
     """
     Build a MarketContext for a given event_date by fetching live
-    SPY, XBI, and VIX data.
+    SPY, XBI, and VIX data in a single batched download.
     """
-    spy_ret  = fetch_price_return("SPY",  event_date, lookback_days)
-    xbi_ret  = fetch_price_return("XBI",  event_date, lookback_days)
-    vix_lvl  = fetch_vix_level(event_date)
+    start    = event_date - _context_window(lookback_days)
+    values   = _fetch_values(
+        {
+            "SPY":  (_cache_key("SPY", event_date, lookback_days),
+                     lambda df: _period_return(df, "SPY", event_date, lookback_days)),
+            "XBI":  (_cache_key("XBI", event_date, lookback_days),
+                     lambda df: _period_return(df, "XBI", event_date, lookback_days)),
+            "^VIX": (_cache_key("^VIX", event_date, "close"), _last_close),
+        },
+        start, event_date,
+    )
+    spy_ret  = values["SPY"]
+    xbi_ret  = values["XBI"]
+    vix_lvl  = values["^VIX"]
     trend    = classify_sector_trend(spy_ret, xbi_ret, vix_lvl)
+    return _make_context(event_date, spy_ret, xbi_ret, vix_lvl, trend)
+
+
+def build_market_contexts_batch(
+    event_dates: Sequence[date],
+    lookback_days: int = 5,
+) -> List[MarketContext]:
+    """
+    build_market_context for many dates at once.  Cache misses across all
+    dates share one grouped download spanning every date's window, and the
+    sector trends are classified in a single classify_sector_trend_batch
+    call.  Returns one MarketContext per input date, in order.
+    """
+    if not event_dates:
+        return []
+    window = _context_window(lookback_days)
+    compute = {
+        "SPY":  lambda df, d: _period_return(df, "SPY", d, lookback_days),
+        "XBI":  lambda df, d: _period_return(df, "XBI", d, lookback_days),
+        "^VIX": lambda df, d: _last_close(df),
+    }
+    lookback_tag = {"SPY": lookback_days, "XBI": lookback_days, "^VIX": "close"}
+    keys = {
+        (d, t): _cache_key(t, d, lookback_tag[t])
+        for d in set(event_dates) for t in compute
+    }
+
+    cached = _cache_get([k for (d, _), k in keys.items() if _is_cacheable(d)])
+    values: Dict[Tuple[date, str], Optional[float]] = {
+        dt: cached.get(k) for dt, k in keys.items()
+    }
+    missing = [dt for dt, v in values.items() if v is None]
+    if missing:
+        miss_dates = [d for d, _ in missing]
+        frames = _download_grouped(tuple(compute), min(miss_dates) - window, max(miss_dates))
+        fresh = {}
+        for d, t in missing:
+            df = frames.get(t)
+            if df is not None:
+                df = df.loc[(d - window).isoformat():d.isoformat()]
+            values[(d, t)] = v = compute[t](df, d)
+            if v is not None and _is_cacheable(d):
+                fresh[keys[(d, t)]] = v
+        if fresh:
+            _cache_put(fresh)
+
+    spy = np.array([values[(d, "SPY")] for d in event_dates], dtype=np.float64)
+    xbi = np.array([values[(d, "XBI")] for d in event_dates], dtype=np.float64)
+    vix = np.array([values[(d, "^VIX")] for d in event_dates], dtype=np.float64)
+    trends = classify_sector_trend_batch(spy, xbi, vix)
+
+    return [
+        _make_context(
+            d, values[(d, "SPY")], values[(d, "XBI")], values[(d, "^VIX")], str(trend)
+        )
+        for d, trend in zip(event_dates, trends)
+    ]
+
+
+def _context_window(lookback_days: int) -> timedelta:
+    # Wide enough for both the SPY/XBI lookback and the 5-day VIX window
+    return timedelta(days=max(lookback_days * 2, 5))
 
+
+def _make_context(
+    event_date: date,
+    spy_ret: Optional[float],
+    xbi_ret: Optional[float],
+    vix_lvl: Optional[float],
+    trend: str,
+) -> MarketContext:
     return MarketContext(
         spy_5d_return=spy_ret,
         xbi_5d_return=xbi_ret,
@@ -165,14 +453,15 @@ def fetch_post_event_moves(
     Fetch single-day % moves for ticker, SPY, and XBI on event_date.
     Returns (ticker_move, spy_move, xbi_move).
     """
-    def _day_return(t: str) -> Optional[float]:
-        return fetch_price_return(t, event_date, lookback_days=1)
+    def _day_return(t: str):
+        return lambda df: _period_return(df, t, event_date, lookback_days=1)
 
-    return (
-        _day_return(ticker),
-        _day_return("SPY"),
-        _day_return("XBI"),
+    tickers = (ticker, "SPY", "XBI")
+    values  = _fetch_values(
+        {t: (_cache_key(t, event_date, 1), _day_return(t)) for t in tickers},
+        event_date - timedelta(days=2), event_date,
     )
+    return values[ticker], values["SPY"], values["XBI"]
 
 
 def get_macro_calendar() -> Dict[str, str]:
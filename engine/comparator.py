@@ -3,16 +3,22 @@ Compares biotech stock performance against market benchmarks (SPY, XBI)
 and generates qualitative return reports for options post-mortems.
 """
 import logging
-from dataclasses import dataclass
-from typing import List, Optional, Dict
+import sys
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
-from models.event import BiotechEvent, EventOutcome
-from models.rating import OptionsRating
+import numpy as np
+
+from models.event import BiotechEvent, EventOutcome, EVENT_TYPE_VALUES, OUTCOME_VALUES
+from models.rating import OptionsRating, GRADE_VALUES
 
 logger = logging.getLogger(__name__)
 
+_PENDING = EventOutcome.PENDING
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReturnComparison:
     """
     Post-event return comparison for a single BiotechEvent.
@@ -31,32 +37,71 @@ class ReturnComparison:
     rating_score:      Optional[float]
 
     def to_dict(self) -> dict:
-        return {
-            "event_id":        self.event_id,
-            "ticker":          self.ticker,
-            "event_type":      self.event_type,
-            "outcome":         self.outcome,
-            "actual_move_pct": self.actual_move_pct,
-            "spy_move_pct":    self.spy_move_pct,
-            "xbi_move_pct":    self.xbi_move_pct,
-            "relative_to_spy": self.relative_to_spy,
-            "relative_to_xbi": self.relative_to_xbi,
-            "iv_crush_pct":    self.iv_crush_pct,
-            "rating_grade":    self.rating_grade,
-            "rating_score":    self.rating_score,
-        }
+        return {k: getattr(self, k) for k in _RC_FIELDS}
 
+    # Single-row helpers; aggregations count relative_to_* > 0 directly
+    # instead of calling these per comparison.
     def outperformed_market(self) -> Optional[bool]:
         """True if stock outperformed SPY on event day."""
-        if self.relative_to_spy is None:
-            return None
-        return self.relative_to_spy > 0
+        r = self.relative_to_spy
+        return None if r is None else r > 0
 
     def outperformed_sector(self) -> Optional[bool]:
         """True if stock outperformed XBI on event day."""
-        if self.relative_to_xbi is None:
-            return None
-        return self.relative_to_xbi > 0
+        r = self.relative_to_xbi
+        return None if r is None else r > 0
+
+
+_RC_FIELDS = tuple(f.name for f in fields(ReturnComparison))
+
+
+@dataclass(eq=False)
+class ComparisonBatch:
+    """
+    Column-oriented (SoA) view of many ReturnComparisons for bulk analytics.
+    Numeric columns are contiguous float64 arrays with NaN for missing
+    values; tickers and grades are object arrays.
+    """
+    ticker:      np.ndarray
+    grade:       np.ndarray
+    actual:      np.ndarray
+    spy:         np.ndarray
+    xbi:         np.ndarray
+    alpha_spy:   np.ndarray
+    alpha_xbi:   np.ndarray
+    iv_crush:    np.ndarray
+    score:       np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.actual)
+
+    @classmethod
+    def from_list(cls, comparisons: List[ReturnComparison]) -> "ComparisonBatch":
+        """Fill pre-allocated columns in a single pass over `comparisons`."""
+        n = len(comparisons)
+        nan = np.nan
+        ticker = np.empty(n, dtype=object)
+        grade  = np.empty(n, dtype=object)
+        actual, spy, xbi, alpha_spy, alpha_xbi, iv_crush, score = (
+            np.empty(n, dtype=np.float64) for _ in range(7)
+        )
+        for i, c in enumerate(comparisons):
+            ticker[i]    = c.ticker
+            grade[i]     = c.rating_grade
+            actual[i]    = nan if c.actual_move_pct is None else c.actual_move_pct
+            spy[i]       = nan if c.spy_move_pct is None else c.spy_move_pct
+            xbi[i]       = nan if c.xbi_move_pct is None else c.xbi_move_pct
+            alpha_spy[i] = nan if c.relative_to_spy is None else c.relative_to_spy
+            alpha_xbi[i] = nan if c.relative_to_xbi is None else c.relative_to_xbi
+            iv_crush[i]  = nan if c.iv_crush_pct is None else c.iv_crush_pct
+            score[i]     = nan if c.rating_score is None else c.rating_score
+        return cls(ticker, grade, actual, spy, xbi, alpha_spy, alpha_xbi, iv_crush, score)
+
+    def stat_columns(self) -> np.ndarray:
+        """(n, 6) C-contiguous block laid out as STAT_COLUMNS."""
+        return np.column_stack(
+            (self.actual, self.spy, self.xbi, self.alpha_spy, self.alpha_xbi, self.iv_crush)
+        )
 
 
 def build_comparison(
@@ -72,45 +117,127 @@ def build_comparison(
     return ReturnComparison(
         event_id        = event.event_id or "",
         ticker          = event.ticker,
-        event_type      = event.event_type.value,
-        outcome         = event.outcome.value,
+        event_type      = EVENT_TYPE_VALUES[event.event_type],
+        outcome         = OUTCOME_VALUES[event.outcome],
         actual_move_pct = event.actual_move_pct,
         spy_move_pct    = event.spy_move_pct,
         xbi_move_pct    = event.xbi_move_pct,
         relative_to_spy = rel_spy,
         relative_to_xbi = rel_xbi,
         iv_crush_pct    = event.iv_crush_pct,
-        rating_grade    = rating.grade.value if rating else None,
+        rating_grade    = GRADE_VALUES[rating.grade] if rating else None,
         rating_score    = rating.composite_score if rating else None,
     )
 
 
+def iter_comparisons(
+    events: Iterable[BiotechEvent],
+    ratings: Optional[Dict[str, OptionsRating]] = None,
+) -> Iterator[ReturnComparison]:
+    """
+    Lazily yield a ReturnComparison for each resolved event, so report
+    pipelines never hold the full comparison list in memory.
+    `ratings` is a dict mapping event_id -> OptionsRating.
+    """
+    ratings = ratings or {}
+    pending = _PENDING
+    # Missing move is the common case (every pending event) and the
+    # cheapest test, so it goes first; enum members compare by identity.
+    for e in events:
+        if e.actual_move_pct is not None and e.outcome is not pending:
+            yield build_comparison(e, ratings.get(e.event_id or ""))
+
+
+def _float_column(values: Iterable[Optional[float]], n: int) -> np.ndarray:
+    """float64 array of length `n` with NaN standing in for None."""
+    return np.fromiter(
+        (np.nan if v is None else v for v in values), dtype=np.float64, count=n
+    )
+
+
+def _round4(values: np.ndarray) -> np.ndarray:
+    """
+    Python round(v, 4) of each element, matching relative_move(); np.round
+    scales by 10**4 first and can land on the other side of a tie.
+    """
+    return np.array([round(v, 4) for v in values.tolist()], dtype=np.float64)
+
+
+def _optional(values: np.ndarray) -> List[Optional[float]]:
+    """Back to Python floats, mapping NaN to None."""
+    return [None if v != v else v for v in values.tolist()]
+
+
 def batch_compare(
     events: List[BiotechEvent],
     ratings: Optional[Dict[str, OptionsRating]] = None,
-) -> List[ReturnComparison]:
+    as_batch: bool = False,
+) -> Union[List[ReturnComparison], ComparisonBatch]:
     """
     Build comparisons for all resolved events.
     `ratings` is a dict mapping event_id -> OptionsRating.
+    With `as_batch=True` the result is a columnar ComparisonBatch.
+
+    Relative moves are computed for the whole set in one vector op
+    instead of per-event relative_move() calls.
     """
     ratings = ratings or {}
+    pending = _PENDING
     resolved = [
         e for e in events
-        if e.outcome != EventOutcome.PENDING and e.actual_move_pct is not None
+        if e.actual_move_pct is not None and e.outcome is not pending
     ]
-    comparisons = [
-        build_comparison(e, ratings.get(e.event_id or ""))
-        for e in resolved
+    n = len(resolved)
+    linked = [ratings.get(e.event_id or "") for e in resolved]
+
+    actual = _float_column((e.actual_move_pct for e in resolved), n)
+    spy    = _float_column((e.spy_move_pct for e in resolved), n)
+    xbi    = _float_column((e.xbi_move_pct for e in resolved), n)
+    rel_spy = _round4(actual - spy)
+    rel_xbi = _round4(actual - xbi)
+    logger.info("Built %d return comparisons from %d events.", n, len(events))
+
+    if as_batch:
+        ticker = np.empty(n, dtype=object)
+        grade  = np.empty(n, dtype=object)
+        ticker[:] = [e.ticker for e in resolved]
+        grade[:]  = [GRADE_VALUES[r.grade] if r else None for r in linked]
+        return ComparisonBatch(
+            ticker    = ticker,
+            grade     = grade,
+            actual    = actual,
+            spy       = spy,
+            xbi       = xbi,
+            alpha_spy = rel_spy,
+            alpha_xbi = rel_xbi,
+            iv_crush  = _float_column((e.iv_crush_pct for e in resolved), n),
+            score     = _float_column((r.composite_score if r else None for r in linked), n),
+        )
+
+    return [
+        ReturnComparison(
+            event_id        = e.event_id or "",
+            ticker          = e.ticker,
+            event_type      = EVENT_TYPE_VALUES[e.event_type],
+            outcome         = OUTCOME_VALUES[e.outcome],
+            actual_move_pct = e.actual_move_pct,
+            spy_move_pct    = e.spy_move_pct,
+            xbi_move_pct    = e.xbi_move_pct,
+            relative_to_spy = rs,
+            relative_to_xbi = rx,
+            iv_crush_pct    = e.iv_crush_pct,
+            rating_grade    = GRADE_VALUES[r.grade] if r else None,
+            rating_score    = r.composite_score if r else None,
+        )
+        for e, r, rs, rx in zip(resolved, linked, _optional(rel_spy), _optional(rel_xbi))
     ]
-    logger.info("Built %d return comparisons from %d events.", len(comparisons), len(events))
-    return comparisons
 
 
 # ---------------------------------------------------------------------------
 # Aggregate statistics
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BenchmarkStats:
     """
     Aggregate stats for a set of ReturnComparisons.
@@ -127,94 +254,177 @@ class BenchmarkStats:
     positive_outcome_rate: Optional[float]
 
     def to_dict(self) -> dict:
-        return {
-            "n_events":              self.n_events,
-            "avg_actual_move":       self.avg_actual_move,
-            "avg_spy_move":          self.avg_spy_move,
-            "avg_xbi_move":          self.avg_xbi_move,
-            "avg_alpha_vs_spy":      self.avg_alpha_vs_spy,
-            "avg_alpha_vs_xbi":      self.avg_alpha_vs_xbi,
-            "pct_outperform_spy":    self.pct_outperform_spy,
-            "pct_outperform_xbi":    self.pct_outperform_xbi,
-            "avg_iv_crush":          self.avg_iv_crush,
-            "positive_outcome_rate": self.positive_outcome_rate,
-        }
-
-
-def _safe_avg(values: list) -> Optional[float]:
-    filtered = [v for v in values if v is not None]
-    if not filtered:
-        return None
-    return round(sum(filtered) / len(filtered), 4)
+        return {k: getattr(self, k) for k in _STATS_FIELDS}
+
+
+_STATS_FIELDS = tuple(f.name for f in fields(BenchmarkStats))
+
+
+# Numeric ReturnComparison columns aggregated by compute_stats, in the
+# column order of the (n, 6) float64 blocks below.  None is stored as NaN.
+STAT_COLUMNS = (
+    "actual_move_pct", "spy_move_pct", "xbi_move_pct",
+    "relative_to_spy", "relative_to_xbi", "iv_crush_pct",
+)
+_COL_REL_SPY = STAT_COLUMNS.index("relative_to_spy")
+_COL_REL_XBI = STAT_COLUMNS.index("relative_to_xbi")
+# Pulls one comparison's STAT_COLUMNS as a tuple in a single C call
+_COL_GET = attrgetter(*STAT_COLUMNS)
+
+
+class StatsAccumulator:
+    """
+    Single-pass accumulator for BenchmarkStats.
+
+    Comparisons are buffered in blocks of CHUNK_SIZE rows; each block is
+    stacked into an (n, 6) float64 array and reduced with NumPy (per-column
+    NaN-aware sums, counts and >0 counts), so memory stays bounded by one
+    block however many comparisons stream through.
+
+    Usage:
+        acc = StatsAccumulator()
+        for c in comparisons:
+            acc.add(c)
+        stats = acc.result(events)
+    """
+
+    CHUNK_SIZE = 4096
+
+    def __init__(self):
+        self.n = 0
+        self._sums    = np.zeros(len(STAT_COLUMNS), dtype=np.float64)
+        self._counts  = np.zeros(len(STAT_COLUMNS), dtype=np.int64)
+        self._winners = np.zeros(len(STAT_COLUMNS), dtype=np.int64)
+        self._pending: List[tuple] = []
+
+    def add(self, c: ReturnComparison) -> None:
+        self._pending.append(_COL_GET(c))
+        if len(self._pending) >= self.CHUNK_SIZE:
+            self._flush()
+
+    def add_columns(self, cols: np.ndarray) -> None:
+        """Fold in an (n, 6) float64 block laid out as STAT_COLUMNS."""
+        valid = ~np.isnan(cols)
+        # Running sums go in as row 0 and the block is reduced along axis 0,
+        # which NumPy adds row by row: the same left-to-right order as a
+        # plain Python sum over every value seen so far (NaN -> 0.0 adds
+        # exactly nothing), so chunking does not change the result.
+        stacked = np.empty((cols.shape[0] + 1, cols.shape[1]), dtype=np.float64)
+        stacked[0] = self._sums
+        np.copyto(stacked[1:], np.where(valid, cols, 0.0))
+        self.n        += cols.shape[0]
+        self._sums     = stacked.sum(axis=0)
+        self._counts  += np.count_nonzero(valid, axis=0)
+        self._winners += np.count_nonzero(cols > 0, axis=0)
+
+    def _flush(self) -> None:
+        if self._pending:
+            # None -> NaN on conversion to float64
+            self.add_columns(np.array(self._pending, dtype=np.float64))
+            self._pending.clear()
+
+    def track(self, comparisons: Iterable[ReturnComparison]) -> Iterator[ReturnComparison]:
+        """Pass comparisons through unchanged, accumulating each one."""
+        for c in comparisons:
+            self.add(c)
+            yield c
+
+    def result(
+        self,
+        events_for_outcome: Optional[List[BiotechEvent]] = None,
+    ) -> BenchmarkStats:
+        self._flush()
+        n = self.n
+        if n == 0:
+            return BenchmarkStats(
+                n_events=0,
+                avg_actual_move=None, avg_spy_move=None, avg_xbi_move=None,
+                avg_alpha_vs_spy=None, avg_alpha_vs_xbi=None,
+                pct_outperform_spy=None, pct_outperform_xbi=None,
+                avg_iv_crush=None, positive_outcome_rate=None,
+            )
+
+        # Python round, not np.round: the two can disagree in the last digit
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = (self._sums / self._counts).tolist()
+        avgs = [
+            None if not cnt else round(m, 4)
+            for m, cnt in zip(means, self._counts.tolist())
+        ]
+        pct_win = [round(w / n * 100, 2) for w in self._winners.tolist()]
+
+        positive_rate = None
+        if events_for_outcome:
+            positives = sum(
+                1 for e in events_for_outcome
+                if e.outcome in (EventOutcome.POSITIVE, EventOutcome.MIXED)
+            )
+            positive_rate = round(positives / len(events_for_outcome) * 100, 2)
+
+        return BenchmarkStats(
+            n_events              = n,
+            avg_actual_move       = avgs[0],
+            avg_spy_move          = avgs[1],
+            avg_xbi_move          = avgs[2],
+            avg_alpha_vs_spy      = avgs[3],
+            avg_alpha_vs_xbi      = avgs[4],
+            pct_outperform_spy    = pct_win[_COL_REL_SPY],
+            pct_outperform_xbi    = pct_win[_COL_REL_XBI],
+            avg_iv_crush          = avgs[5],
+            positive_outcome_rate = positive_rate,
+        )
 
 
 def compute_stats(
-    comparisons: List[ReturnComparison],
+    comparisons: Union[Iterable[ReturnComparison], ComparisonBatch],
     events_for_outcome: Optional[List[BiotechEvent]] = None,
 ) -> BenchmarkStats:
     """
-    Compute aggregate benchmark stats across a list of ReturnComparisons.
+    Compute aggregate benchmark stats across ReturnComparisons in a
+    single pass (any iterable, including a generator, is accepted).
+    A ComparisonBatch is reduced directly from its columns.
     """
-    n = len(comparisons)
-    if n == 0:
-        return BenchmarkStats(
-            n_events=0,
-            avg_actual_move=None, avg_spy_move=None, avg_xbi_move=None,
-            avg_alpha_vs_spy=None, avg_alpha_vs_xbi=None,
-            pct_outperform_spy=None, pct_outperform_xbi=None,
-            avg_iv_crush=None, positive_outcome_rate=None,
-        )
+    acc = StatsAccumulator()
+    if isinstance(comparisons, ComparisonBatch):
+        acc.add_columns(comparisons.stat_columns())
+    else:
+        for c in comparisons:
+            acc.add(c)
+    return acc.result(events_for_outcome)
 
-    outperform_spy = [c for c in comparisons if c.outperformed_market() is True]
-    outperform_xbi = [c for c in comparisons if c.outperformed_sector() is True]
 
-    positive_rate = None
-    if events_for_outcome:
-        positives = [
-            e for e in events_for_outcome
-            if e.outcome in (EventOutcome.POSITIVE, EventOutcome.MIXED)
-        ]
-        if events_for_outcome:
-            positive_rate = round(len(positives) / len(events_for_outcome) * 100, 2)
-
-    return BenchmarkStats(
-        n_events              = n,
-        avg_actual_move       = _safe_avg([c.actual_move_pct for c in comparisons]),
-        avg_spy_move          = _safe_avg([c.spy_move_pct for c in comparisons]),
-        avg_xbi_move          = _safe_avg([c.xbi_move_pct for c in comparisons]),
-        avg_alpha_vs_spy      = _safe_avg([c.relative_to_spy for c in comparisons]),
-        avg_alpha_vs_xbi      = _safe_avg([c.relative_to_xbi for c in comparisons]),
-        pct_outperform_spy    = round(len(outperform_spy) / n * 100, 2) if n else None,
-        pct_outperform_xbi    = round(len(outperform_xbi) / n * 100, 2) if n else None,
-        avg_iv_crush          = _safe_avg([c.iv_crush_pct for c in comparisons]),
-        positive_outcome_rate = positive_rate,
-    )
+ROW_FMT = "{:<8} {:<20} {:<12} {:>7} {:>7} {:>7} {:>10} {:>10} {:<6} {:>6}"
 
 
-def print_comparison_table(comparisons: List[ReturnComparison]) -> None:
+def _fmt(v: Optional[float], w: int, prec: int = 2) -> str:
+    """Right-aligned fixed-precision cell; only None renders as N/A."""
+    return "N/A".rjust(w) if v is None else f"{v:>{w}.{prec}f}"
+
+
+def print_comparison_table(comparisons: Iterable[ReturnComparison]) -> None:
     """
     Print a formatted ASCII table of return comparisons.
+    Rows are formatted and handed to the (buffered) stdout as they are
+    consumed, so a generator streams through without being materialised.
     """
-    header = (
-        f"{'Ticker':<8} {'Event Type':<20} {'Outcome':<12} "
-        f"{'Move%':>7} {'SPY%':>7} {'XBI%':>7} "
-        f"{'Alpha/SPY':>10} {'Alpha/XBI':>10} "
-        f"{'Grade':<6} {'Score':>6}"
+    header = ROW_FMT.format(
+        "Ticker", "Event Type", "Outcome", "Move%", "SPY%", "XBI%",
+        "Alpha/SPY", "Alpha/XBI", "Grade", "Score",
     )
     sep = "-" * len(header)
-    print(sep)
-    print(header)
-    print(sep)
-    for c in comparisons:
-        row = (
-            f"{c.ticker:<8} {c.event_type:<20} {c.outcome:<12} "
-            f"{c.actual_move_pct or 'N/A':>7} "
-            f"{c.spy_move_pct or 'N/A':>7} "
-            f"{c.xbi_move_pct or 'N/A':>7} "
-            f"{c.relative_to_spy or 'N/A':>10} "
-            f"{c.relative_to_xbi or 'N/A':>10} "
-            f"{c.rating_grade or 'N/A':<6} "
-            f"{c.rating_score or 'N/A':>6}"
-        )
-        print(row)
-    print(sep)
+    out = sys.stdout
+    out.write(f"{sep}\n{header}\n{sep}\n")
+    out.writelines(
+        ROW_FMT.format(
+            c.ticker, c.event_type, c.outcome,
+            _fmt(c.actual_move_pct, 7),
+            _fmt(c.spy_move_pct, 7),
+            _fmt(c.xbi_move_pct, 7),
+            _fmt(c.relative_to_spy, 10),
+            _fmt(c.relative_to_xbi, 10),
+            "N/A" if c.rating_grade is None else c.rating_grade,
+            _fmt(c.rating_score, 6),
+        ) + "\n"
+        for c in comparisons
+    )
+    out.write(sep + "\n")
@@ -2,19 +2,100 @@
 Core qualitative scoring engine.
 Takes a BiotechEvent and produces a full OptionsRating.
 """
+import bisect
 import logging
+import math
 from datetime import date
-from typing import Optional, List
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Tuple, Union
 
-from models.event import BiotechEvent, EventType, SentimentTag
+from models.event import (
+    BiotechEvent, EventOutcome, EventType, SentimentTag, EVENT_TYPE_VALUES, SENTIMENT_VALUES
+)
 from models.rating import (
-    OptionsRating, OptionsStrategy, ScoreBreakdown, RatingGrade, score_to_grade
+    OptionsRating, OptionsStrategy, ScoreBreakdown, RatingGrade, score_to_grade,
+    GRADES, SCORE_COMPONENTS, grade_indices, weighted_totals,
+)
+from collectors.catalyst_tracker import (
+    catalyst_quality_batch, catalyst_quality_score, competitive_moat_score
 )
-from collectors.catalyst_tracker import catalyst_quality_score, competitive_moat_score
 
 logger = logging.getLogger(__name__)
 
 
+# Binary biotech catalysts: high IV going in, large two-sided move on the
+# print.  Shared by every scorer that special-cases FDA/clinical events.
+_BINARY_EVENTS: FrozenSet[EventType] = frozenset({
+    EventType.FDA_PDUFA, EventType.FDA_ADCOM, EventType.CLINICAL_READOUT,
+})
+_HIGH_IV_EVENTS = _BINARY_EVENTS
+
+_TREND_SCORES = {
+    "strong_risk_on":  85,
+    "risk_on":         70,
+    "neutral":         50,
+    "risk_off":        30,
+    "strong_risk_off": 15,
+}
+
+_SENTIMENT_SCORES = {
+    SentimentTag.STRONG_BUY:  90.0,
+    SentimentTag.BUY:         72.0,
+    SentimentTag.NEUTRAL:     50.0,
+    SentimentTag.SELL:        28.0,
+    SentimentTag.STRONG_SELL: 10.0,
+}
+
+# Expected move proxy by event type
+_EXPECTED_MOVE = {
+    EventType.FDA_PDUFA:        85.0,
+    EventType.FDA_ADCOM:        75.0,
+    EventType.CLINICAL_READOUT: 70.0,
+    EventType.PARTNERSHIP:      50.0,
+    EventType.EARNINGS:         45.0,
+    EventType.COMPETITOR_EVENT: 35.0,
+    EventType.MACRO_RELEASE:    30.0,
+    EventType.CONFERENCE_PRES:  25.0,
+    EventType.SEC_FILING:       15.0,
+    EventType.OTHER:            20.0,
+}
+
+# IV rank ladder: <20 -> 40, [20, 40) -> 65, [40, 70] -> 80, >70 -> 55.
+# bisect_right against these bounds picks the bucket; the last bound sits
+# just above 70 so that 70 itself stays in the sweet spot.
+_IV_THRESHOLDS = (20.0, 40.0, math.nextafter(70.0, math.inf))
+_IV_SCORES     = (40.0, 65.0, 80.0, 55.0)
+
+# Suggested delta by strategy family
+_STRADDLE_LIKE = frozenset({
+    OptionsStrategy.LONG_STRADDLE, OptionsStrategy.LONG_STRANGLE, OptionsStrategy.IRON_CONDOR,
+})
+_BULLISH = frozenset({OptionsStrategy.BULL_CALL_SPREAD, OptionsStrategy.LONG_CALL})
+_BEARISH = frozenset({OptionsStrategy.BEAR_PUT_SPREAD, OptionsStrategy.LONG_PUT})
+_STRATEGY_DELTA = {
+    **{s: 0.35 for s in _STRADDLE_LIKE},
+    **{s: 0.45 for s in _BULLISH},
+    **{s: -0.45 for s in _BEARISH},
+}
+
+# Max risk heuristic: cap at 3% of portfolio for A-grade, scale down
+_GRADE_RISK = {
+    RatingGrade.A_PLUS: 3.0,
+    RatingGrade.A:      2.5,
+    RatingGrade.B_PLUS: 2.0,
+    RatingGrade.B:      1.5,
+    RatingGrade.C:      1.0,
+    RatingGrade.D:      0.5,
+    RatingGrade.F:      0.0,
+}
+
+# Heuristic IV score when no IV rank is supplied
+_IV_HEURISTIC = {
+    **{t: 62.0 for t in _HIGH_IV_EVENTS},   # high IV but crush risk -> moderate
+    EventType.EARNINGS:      68.0,
+    EventType.MACRO_RELEASE: 55.0,
+}
+
+
 # ---------------------------------------------------------------------------
 # IV environment heuristics
 # ---------------------------------------------------------------------------
@@ -36,25 +117,16 @@ def _iv_environment_score(
     """
     if iv_rank is not None:
         # High IV rank: better for premium sellers, but also juicy for directional
-        # Sweet spot: 40-70 IV rank
-        if 40 <= iv_rank <= 70:
-            return 80.0
-        elif 20 <= iv_rank < 40:
-            return 65.0
-        elif iv_rank > 70:
-            return 55.0  # risk of IV crush post-event
-        else:
-            return 40.0  # IV rank < 20, expensive on relative basis
+        # Sweet spot: 40-70 IV rank; above 70 risks IV crush post-event;
+        # below 20 options are expensive on a relative basis.  NaN fails
+        # every comparison, so like the original if-ladder it lands in the
+        # < 20 bucket (bisect would put it in the > 70 one).
+        if iv_rank != iv_rank:
+            return _IV_SCORES[0]
+        return _IV_SCORES[bisect.bisect_right(_IV_THRESHOLDS, iv_rank)]
 
     # Heuristic fallback
-    high_iv_events = {EventType.FDA_PDUFA, EventType.FDA_ADCOM, EventType.CLINICAL_READOUT}
-    if event.event_type in high_iv_events:
-        return 62.0   # high IV but crush risk -> moderate
-    elif event.event_type == EventType.EARNINGS:
-        return 68.0
-    elif event.event_type == EventType.MACRO_RELEASE:
-        return 55.0
-    return 60.0
+    return _IV_HEURISTIC.get(event.event_type, 60.0)
 
 
 # ---------------------------------------------------------------------------
@@ -70,18 +142,10 @@ def _market_context_score(event: BiotechEvent) -> float:
     if ctx is None:
         return 50.0   # unknown -> neutral
 
-    trend_scores = {
-        "strong_risk_on":  85,
-        "risk_on":         70,
-        "neutral":         50,
-        "risk_off":        30,
-        "strong_risk_off": 15,
-    }
-    base = trend_scores.get(ctx.sector_trend or "neutral", 50)
+    base = _TREND_SCORES.get(ctx.sector_trend or "neutral", 50)
 
     # XBI-specific adjustment for biotech events
-    biotech_events = {EventType.FDA_PDUFA, EventType.FDA_ADCOM, EventType.CLINICAL_READOUT}
-    if event.event_type in biotech_events and ctx.xbi_5d_return is not None:
+    if event.event_type in _BINARY_EVENTS and ctx.xbi_5d_return is not None:
         if ctx.xbi_5d_return > 3:
             base = min(base + 10, 100)
         elif ctx.xbi_5d_return < -3:
@@ -98,47 +162,70 @@ def _sentiment_alignment_score(event: BiotechEvent) -> float:
     """
     Convert sentiment tag to a directional alignment score (0-100).
     """
-    mapping = {
-        SentimentTag.STRONG_BUY:  90.0,
-        SentimentTag.BUY:         72.0,
-        SentimentTag.NEUTRAL:     50.0,
-        SentimentTag.SELL:        28.0,
-        SentimentTag.STRONG_SELL: 10.0,
-    }
-    return mapping.get(event.sentiment, 50.0)
+    return _SENTIMENT_SCORES.get(event.sentiment, 50.0)
 
 
 # ---------------------------------------------------------------------------
 # Historical accuracy scoring
 # ---------------------------------------------------------------------------
 
+# (ticker, event_type) -> (resolved count, positive-or-mixed count)
+HistoricalIndex = Dict[Tuple[str, EventType], Tuple[int, int]]
+
+
+def build_historical_index(past_events: Optional[List[BiotechEvent]]) -> HistoricalIndex:
+    """
+    Aggregate resolved past events by (ticker, event_type) in one walk, so
+    scoring many events against the same history is a dict lookup each.
+    """
+    pending   = EventOutcome.PENDING
+    favorable = (EventOutcome.POSITIVE, EventOutcome.MIXED)
+
+    index: HistoricalIndex = {}
+    for e in past_events or ():
+        if e.outcome is pending:
+            continue
+        key = (e.ticker, e.event_type)
+        total, positives = index.get(key, (0, 0))
+        index[key] = (total + 1, positives + (e.outcome in favorable))
+    return index
+
+
 def _historical_accuracy_score(
     event: BiotechEvent,
     past_events: Optional[List[BiotechEvent]] = None,
+    historical_index: Optional[HistoricalIndex] = None,
 ) -> float:
     """
     Estimate historical accuracy of similar calls for this ticker.
-    Uses resolved past events of the same type for the same ticker.
+    Uses resolved past events of the same type for the same ticker,
+    or the pre-aggregated counts in `historical_index` when given.
     Falls back to 50 if no history.
     """
+    if historical_index is not None:
+        total, positives = historical_index.get((event.ticker, event.event_type), (0, 0))
+        if not total:
+            return 50.0
+        return round((positives / total) * 100, 2)
+
     if not past_events:
         return 50.0
 
-    from models.event import EventOutcome
-    same_type = [
-        e for e in past_events
-        if e.ticker == event.ticker
-        and e.event_type == event.event_type
-        and e.outcome != EventOutcome.PENDING
-    ]
-    if not same_type:
-        return 50.0
+    pending   = EventOutcome.PENDING
+    favorable = (EventOutcome.POSITIVE, EventOutcome.MIXED)
+    ticker, event_type = event.ticker, event.event_type
 
-    positives = sum(
-        1 for e in same_type
-        if e.outcome in (EventOutcome.POSITIVE, EventOutcome.MIXED)
-    )
-    rate = (positives / len(same_type)) * 100
+    total = positives = 0
+    for e in past_events:
+        if e.ticker != ticker or e.event_type != event_type or e.outcome is pending:
+            continue
+        total += 1
+        if e.outcome in favorable:
+            positives += 1
+
+    if not total:
+        return 50.0
+    rate = (positives / total) * 100
     return round(rate, 2)
 
 
@@ -151,26 +238,32 @@ def _risk_reward_score(event: BiotechEvent) -> float:
     Estimate risk-reward attractiveness (0-100).
     Higher-impact binary events have larger expected moves -> more favorable R/R.
     """
-    # Expected move proxy by event type
-    expected_move_proxy = {
-        EventType.FDA_PDUFA:        85,
-        EventType.FDA_ADCOM:        75,
-        EventType.CLINICAL_READOUT: 70,
-        EventType.PARTNERSHIP:      50,
-        EventType.EARNINGS:         45,
-        EventType.COMPETITOR_EVENT: 35,
-        EventType.MACRO_RELEASE:    30,
-        EventType.CONFERENCE_PRES:  25,
-        EventType.SEC_FILING:       15,
-        EventType.OTHER:            20,
-    }
-    return float(expected_move_proxy.get(event.event_type, 30))
+    return _EXPECTED_MOVE.get(event.event_type, 30.0)
 
 
 # ---------------------------------------------------------------------------
 # Strategy recommender
 # ---------------------------------------------------------------------------
 
+# Sentiment buckets: 0 = bearish (<=30), 1 = neutral, 2 = mildly bullish
+# (>=65, the partnership cut-off), 3 = bullish (>=70)
+_S = OptionsStrategy
+_DIRECTIONAL_BINARY = (_S.BEAR_PUT_SPREAD, _S.LONG_STRADDLE,    _S.LONG_STRADDLE,    _S.BULL_CALL_SPREAD)
+_STRATEGY_BY_BUCKET = {
+    **{t: _DIRECTIONAL_BINARY for t in _BINARY_EVENTS},
+    EventType.EARNINGS:      (_S.BEAR_PUT_SPREAD,  _S.IRON_CONDOR,      _S.IRON_CONDOR,      _S.BULL_CALL_SPREAD),
+    EventType.MACRO_RELEASE: (_S.CALENDAR_SPREAD,  _S.CALENDAR_SPREAD,  _S.CALENDAR_SPREAD,  _S.CALENDAR_SPREAD),
+    EventType.PARTNERSHIP:   (_S.BULL_CALL_SPREAD, _S.BULL_CALL_SPREAD, _S.LONG_CALL,        _S.LONG_CALL),
+}
+_STRATEGY_TABLE = {
+    (event_type, bucket): strategy
+    for event_type, row in _STRATEGY_BY_BUCKET.items()
+    for bucket, strategy in enumerate(row)
+}
+_DEFAULT_STRATEGY = OptionsStrategy.LONG_STRADDLE
+del _S
+
+
 def recommend_strategy(
     event: BiotechEvent,
     sentiment_score: float,
@@ -185,33 +278,47 @@ def recommend_strategy(
     - Earnings neutral -> iron condor (premium capture)
     - Macro events -> calendar spread or iron condor
     """
-    binary_events = {EventType.FDA_PDUFA, EventType.FDA_ADCOM, EventType.CLINICAL_READOUT}
+    if sentiment_score <= 30:
+        bucket = 0
+    elif sentiment_score >= 70:
+        bucket = 3
+    elif sentiment_score >= 65:
+        bucket = 2
+    else:
+        bucket = 1
+    return _STRATEGY_TABLE.get((event.event_type, bucket), _DEFAULT_STRATEGY)
 
-    if event.event_type in binary_events:
-        if sentiment_score >= 70:
-            return OptionsStrategy.BULL_CALL_SPREAD
-        elif sentiment_score <= 30:
-            return OptionsStrategy.BEAR_PUT_SPREAD
-        else:
-            return OptionsStrategy.LONG_STRADDLE
 
-    elif event.event_type == EventType.EARNINGS:
-        if sentiment_score >= 70:
-            return OptionsStrategy.BULL_CALL_SPREAD
-        elif sentiment_score <= 30:
-            return OptionsStrategy.BEAR_PUT_SPREAD
-        else:
-            return OptionsStrategy.IRON_CONDOR
+# ---------------------------------------------------------------------------
+# Numeric core
+# ---------------------------------------------------------------------------
 
-    elif event.event_type == EventType.MACRO_RELEASE:
-        return OptionsStrategy.CALENDAR_SPREAD
+def _finalize(
+    breakdown: ScoreBreakdown,
+    custom_weights: Optional[dict],
+    event_type: EventType,
+    strategy: OptionsStrategy,
+) -> Tuple[float, RatingGrade, float, float, int]:
+    """
+    Turn sub-scores into (composite, grade, delta, max_risk, dte).
+    Table lookups only; no objects are built here.
+    """
+    composite = breakdown.weighted_total(custom_weights)
+    grade     = score_to_grade(composite)
+    return (composite, grade) + _trade_params(grade, event_type, strategy)
 
-    elif event.event_type == EventType.PARTNERSHIP:
-        if sentiment_score >= 65:
-            return OptionsStrategy.LONG_CALL
-        return OptionsStrategy.BULL_CALL_SPREAD
 
-    return OptionsStrategy.LONG_STRADDLE
+def _trade_params(
+    grade: RatingGrade,
+    event_type: EventType,
+    strategy: OptionsStrategy,
+) -> Tuple[float, float, int]:
+    """(delta, max_risk, dte) for a graded setup."""
+    # Suggested DTE heuristic: binary/FDA = 30-45 DTE, earnings = 14-21 DTE
+    dte      = 35 if event_type in _BINARY_EVENTS else 21
+    delta    = _STRATEGY_DELTA.get(strategy, 0.40)
+    max_risk = _GRADE_RISK.get(grade, 1.0)
+    return delta, max_risk, dte
 
 
 # ---------------------------------------------------------------------------
@@ -224,6 +331,7 @@ def score_event(
     past_events: Optional[List[BiotechEvent]] = None,
     custom_weights: Optional[dict] = None,
     confidence_override: Optional[float] = None,
+    historical_index: Optional[HistoricalIndex] = None,
 ) -> OptionsRating:
     """
     Primary entry point: takes a BiotechEvent and returns a fully
@@ -236,6 +344,8 @@ def score_event(
     past_events      : Historical events for this ticker (for accuracy scoring).
     custom_weights   : Override the default ScoreBreakdown weights.
     confidence_override: Manually set confidence (0-100); otherwise auto-computed.
+    historical_index : Output of build_historical_index(); takes precedence
+                       over past_events when scoring many events at once.
     """
     if event.event_id is None:
         raise ValueError("event.event_id must be set before scoring.")
@@ -245,7 +355,7 @@ def score_event(
     sa  = _sentiment_alignment_score(event)
     mc  = _market_context_score(event)
     iv  = _iv_environment_score(event, iv_rank)
-    ha  = _historical_accuracy_score(event, past_events)
+    ha  = _historical_accuracy_score(event, past_events, historical_index)
     cm  = competitive_moat_score(event)
     rr  = _risk_reward_score(event)
 
@@ -259,45 +369,36 @@ def score_event(
         risk_reward         = rr,
     )
 
-    composite = breakdown.weighted_total(custom_weights)
-    grade     = score_to_grade(composite)
-    strategy  = recommend_strategy(event, sa)
+    strategy = recommend_strategy(event, sa)
+    composite, grade, delta, max_risk, dte = _finalize(
+        breakdown, custom_weights, event.event_type, strategy
+    )
+    return _make_rating(
+        event, breakdown, strategy, composite, grade, delta, max_risk, dte,
+        confidence_override, date.today(),
+    )
+
 
+def _make_rating(
+    event: BiotechEvent,
+    breakdown: ScoreBreakdown,
+    strategy: OptionsStrategy,
+    composite: float,
+    grade: RatingGrade,
+    delta: float,
+    max_risk: float,
+    dte: int,
+    confidence_override: Optional[float],
+    rating_date: date,
+) -> OptionsRating:
     # Confidence: average of catalyst_quality and historical_accuracy
     confidence = confidence_override if confidence_override is not None else \
-                 round((cq + ha) / 2, 2)
-
-    # Suggested DTE heuristic: binary/FDA = 30-45 DTE, earnings = 14-21 DTE
-    binary_events = {EventType.FDA_PDUFA, EventType.FDA_ADCOM, EventType.CLINICAL_READOUT}
-    dte = 35 if event.event_type in binary_events else 21
-
-    # Delta heuristic
-    if strategy in (OptionsStrategy.LONG_STRADDLE, OptionsStrategy.LONG_STRANGLE,
-                    OptionsStrategy.IRON_CONDOR):
-        delta = 0.35
-    elif strategy in (OptionsStrategy.BULL_CALL_SPREAD, OptionsStrategy.LONG_CALL):
-        delta = 0.45
-    elif strategy in (OptionsStrategy.BEAR_PUT_SPREAD, OptionsStrategy.LONG_PUT):
-        delta = -0.45
-    else:
-        delta = 0.40
-
-    # Max risk heuristic: cap at 3% of portfolio for A-grade, scale down
-    grade_risk = {
-        RatingGrade.A_PLUS: 3.0,
-        RatingGrade.A:      2.5,
-        RatingGrade.B_PLUS: 2.0,
-        RatingGrade.B:      1.5,
-        RatingGrade.C:      1.0,
-        RatingGrade.D:      0.5,
-        RatingGrade.F:      0.0,
-    }
-    max_risk = grade_risk.get(grade, 1.0)
+                 round((breakdown.catalyst_quality + breakdown.historical_accuracy) / 2, 2)
 
     rating = OptionsRating(
         event_id              = event.event_id,
         ticker                = event.ticker,
-        rating_date           = date.today(),
+        rating_date           = rating_date,
         recommended_strategy  = strategy,
         score_breakdown       = breakdown,
         confidence_pct        = confidence,
@@ -305,14 +406,70 @@ def score_event(
         suggested_delta       = abs(delta),
         max_risk_pct_port     = max_risk,
         notes                 = (
-            f"Auto-scored: {event.event_type.value} | "
+            f"Auto-scored: {EVENT_TYPE_VALUES[event.event_type]} | "
             f"{event.pipeline_stage or 'N/A'} | "
-            f"sentiment={event.sentiment.value}"
+            f"sentiment={SENTIMENT_VALUES[event.sentiment]}"
         ),
     )
 
-    logger.info(
-        "Scored %s -> %s (%.1f) | Strategy: %s | MaxRisk: %.1f%%",
-        event.event_id, grade.value, composite, strategy.value, max_risk
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Scored %s -> %s (%.1f) | Strategy: %s | MaxRisk: %.1f%%",
+            event.event_id, grade.value, composite, strategy.value, max_risk
+        )
     return rating
+
+
+def score_events(
+    events: List[BiotechEvent],
+    iv_ranks: Optional[Union[Mapping[str, float], Sequence[float]]] = None,
+    past_events: Optional[List[BiotechEvent]] = None,
+    custom_weights: Optional[dict] = None,
+) -> List[OptionsRating]:
+    """
+    Score many events in one call.
+
+    `iv_ranks` is either a mapping of event_id -> IV Rank, or a sequence /
+    array aligned with `events` (None entries mean unknown).  Events without
+    a rank use the heuristic; a NaN rank scores as in score_event.  The history is indexed once and the rating
+    date is read once for the whole batch; sub-scores are stacked into an
+    (n, 7) matrix so composites and grades are computed column-wise.
+    """
+    if iv_ranks is None:
+        ranks = [None] * len(events)
+    elif isinstance(iv_ranks, Mapping):
+        ranks = [iv_ranks.get(e.event_id) for e in events]
+    else:
+        ranks = [None if r is None else float(r) for r in iv_ranks]
+
+    for e in events:
+        if e.event_id is None:
+            raise ValueError("event.event_id must be set before scoring.")
+
+    import numpy as np
+    today = date.today()
+    idx = build_historical_index(past_events)
+
+    # (n, 7) sub-score matrix in SCORE_COMPONENTS order
+    sub_scores = np.empty((len(events), len(SCORE_COMPONENTS)), dtype=np.float64)
+    sub_scores[:, 0] = catalyst_quality_batch(events)
+    sub_scores[:, 1] = [_sentiment_alignment_score(e) for e in events]
+    sub_scores[:, 2] = [_market_context_score(e) for e in events]
+    sub_scores[:, 3] = [_iv_environment_score(e, r) for e, r in zip(events, ranks)]
+    sub_scores[:, 4] = [_historical_accuracy_score(e, historical_index=idx) for e in events]
+    sub_scores[:, 5] = [competitive_moat_score(e) for e in events]
+    sub_scores[:, 6] = [_risk_reward_score(e) for e in events]
+
+    composites = weighted_totals(sub_scores, custom_weights)
+    grade_idx  = grade_indices(composites)
+
+    ratings = []
+    for e, row, composite, gi in zip(events, sub_scores.tolist(), composites, grade_idx):
+        breakdown = ScoreBreakdown(*row)
+        strategy  = recommend_strategy(e, breakdown.sentiment_alignment)
+        grade     = GRADES[gi]
+        delta, max_risk, dte = _trade_params(grade, e.event_type, strategy)
+        ratings.append(_make_rating(
+            e, breakdown, strategy, composite, grade, delta, max_risk, dte, None, today,
+        ))
+    return ratings
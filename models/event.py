@@ -4,6 +4,7 @@ Data models for biotech catalyst events and market releases.
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
+from operator import attrgetter
 from typing import Optional, List
 
 
@@ -37,7 +38,14 @@ class SentimentTag(str, Enum):
     STRONG_SELL = "strong_sell"
 
 
-@dataclass
+# Member -> string value, for hot paths that would otherwise go through
+# the Enum.value descriptor once per row
+EVENT_TYPE_VALUES = {e: e.value for e in EventType}
+OUTCOME_VALUES    = {o: o.value for o in EventOutcome}
+SENTIMENT_VALUES  = {s: s.value for s in SentimentTag}
+
+
+@dataclass(slots=True, frozen=True)
 class MarketContext:
     """Snapshot of broad market conditions around the event date."""
     spy_5d_return: Optional[float] = None   # SPY 5-day return before event
@@ -47,7 +55,7 @@ class MarketContext:
     notes:         Optional[str]   = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BiotechEvent:
     """
     Core record for any catalyst or market release being tracked.
@@ -93,26 +101,30 @@ class BiotechEvent:
         return None
 
     def to_dict(self) -> dict:
-        return {
-            "event_id":         self.event_id,
-            "ticker":           self.ticker,
-            "company_name":     self.company_name,
-            "event_type":       self.event_type.value,
-            "event_date":       self.event_date.isoformat(),
-            "description":      self.description,
-            "sentiment":        self.sentiment.value,
-            "analyst_notes":    self.analyst_notes,
-            "pipeline_stage":   self.pipeline_stage,
-            "indication":       self.indication,
-            "primary_endpoint": self.primary_endpoint,
-            "competing_drugs":  self.competing_drugs,
-            "outcome":          self.outcome.value,
-            "actual_move_pct":  self.actual_move_pct,
-            "spy_move_pct":     self.spy_move_pct,
-            "xbi_move_pct":     self.xbi_move_pct,
-            "iv_crush_pct":     self.iv_crush_pct,
-            "relative_move":    self.relative_move(),
-            "xbi_relative_move":self.xbi_relative_move(),
-            "outcome_notes":    self.outcome_notes,
-            "tags":             self.tags,
-        }
+        return {k: get(self) for k, get in _EVENT_DICT_GETTERS}
+
+
+# (key, getter) pairs for BiotechEvent.to_dict, in output order
+_EVENT_DICT_GETTERS = (
+    ("event_id",          attrgetter("event_id")),
+    ("ticker",            attrgetter("ticker")),
+    ("company_name",      attrgetter("company_name")),
+    ("event_type",        lambda e: EVENT_TYPE_VALUES[e.event_type]),
+    ("event_date",        lambda e: e.event_date.isoformat()),
+    ("description",       attrgetter("description")),
+    ("sentiment",         lambda e: SENTIMENT_VALUES[e.sentiment]),
+    ("analyst_notes",     attrgetter("analyst_notes")),
+    ("pipeline_stage",    attrgetter("pipeline_stage")),
+    ("indication",        attrgetter("indication")),
+    ("primary_endpoint",  attrgetter("primary_endpoint")),
+    ("competing_drugs",   attrgetter("competing_drugs")),
+    ("outcome",           lambda e: OUTCOME_VALUES[e.outcome]),
+    ("actual_move_pct",   attrgetter("actual_move_pct")),
+    ("spy_move_pct",      attrgetter("spy_move_pct")),
+    ("xbi_move_pct",      attrgetter("xbi_move_pct")),
+    ("iv_crush_pct",      attrgetter("iv_crush_pct")),
+    ("relative_move",     BiotechEvent.relative_move),
+    ("xbi_relative_move", BiotechEvent.xbi_relative_move),
+    ("outcome_notes",     attrgetter("outcome_notes")),
+    ("tags",              attrgetter("tags")),
+)
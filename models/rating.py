@@ -1,10 +1,14 @@
 """models/rating.py
 Options trade rating derived from scored biotech events.
 """
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import Optional, List
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 class OptionsStrategy(str, Enum):
@@ -32,18 +36,55 @@ class RatingGrade(str, Enum):
     F       = "F"    # 0-29    Avoid
 
 
-def score_to_grade(score: float) -> RatingGrade:
-    """Map 0-100 composite score to letter grade."""
-    if score >= 90:  return RatingGrade.A_PLUS
-    if score >= 80:  return RatingGrade.A
-    if score >= 70:  return RatingGrade.B_PLUS
-    if score >= 60:  return RatingGrade.B
-    if score >= 50:  return RatingGrade.C
-    if score >= 30:  return RatingGrade.D
-    return RatingGrade.F
+# Member -> string value, for serialization paths that would otherwise go
+# through the Enum.value descriptor once per row
+STRATEGY_VALUES = {s: s.value for s in OptionsStrategy}
+GRADE_VALUES    = {g: g.value for g in RatingGrade}
+
 
+# Lower bound of each grade above F; bisect_right(GRADE_THRESHOLDS, score)
+# indexes GRADES for any real score (NaN would bisect to the top, so it is
+# mapped to F explicitly, as the original if-ladder did)
+GRADE_THRESHOLDS = (30, 50, 60, 70, 80, 90)
+GRADES = (
+    RatingGrade.F, RatingGrade.D, RatingGrade.C, RatingGrade.B,
+    RatingGrade.B_PLUS, RatingGrade.A, RatingGrade.A_PLUS,
+)
 
-@dataclass
+
+def score_to_grade(score: float) -> RatingGrade:
+    """Map 0-100 composite score to letter grade."""
+    if score != score:
+        return RatingGrade.F
+    return GRADES[bisect_right(GRADE_THRESHOLDS, score)]
+
+
+def grade_indices(scores: Sequence[float]) -> List[int]:
+    """Index into GRADES for each score, as score_to_grade does (NaN -> F)."""
+    import numpy as np
+    arr = np.asarray(scores, dtype=np.float64)
+    idx = np.searchsorted(GRADE_THRESHOLDS, arr, side="right")
+    idx[np.isnan(arr)] = 0
+    return idx.tolist()
+
+
+# ScoreBreakdown components in field order, and their default weights
+SCORE_COMPONENTS = (
+    "catalyst_quality", "sentiment_alignment", "market_context", "iv_environment",
+    "historical_accuracy", "competitive_moat", "risk_reward",
+)
+DEFAULT_WEIGHTS = {
+    "catalyst_quality":    0.25,
+    "sentiment_alignment": 0.15,
+    "market_context":      0.15,
+    "iv_environment":      0.15,
+    "historical_accuracy": 0.10,
+    "competitive_moat":    0.10,
+    "risk_reward":         0.10,
+}
+
+
+@dataclass(slots=True)
 class ScoreBreakdown:
     """
     Decomposed scoring components (each 0-100).
@@ -69,16 +110,23 @@ class ScoreBreakdown:
           competitive_moat      0.10
           risk_reward           0.10
         """
-        default_weights = {
-            "catalyst_quality":    0.25,
-            "sentiment_alignment": 0.15,
-            "market_context":      0.15,
-            "iv_environment":      0.15,
-            "historical_accuracy": 0.10,
-            "competitive_moat":    0.10,
-            "risk_reward":         0.10,
-        }
-        w = weights or default_weights
+        if weights is None:
+            # DEFAULT_WEIGHTS inlined (keep in sync): straight-line, no dict
+            # probes, same term order as the general case below
+            total = (
+                self.catalyst_quality    * 0.25 +
+                self.sentiment_alignment * 0.15 +
+                self.market_context      * 0.15 +
+                self.iv_environment      * 0.15 +
+                self.historical_accuracy * 0.10 +
+                self.competitive_moat    * 0.10 +
+                self.risk_reward         * 0.10
+            )
+            # Same result as round(min(max(total, 0.0), 100.0), 2), NaN and
+            # -0.0 included, without the two builtin calls
+            return round(0.0 if total < 0.0 else 100.0 if total > 100.0 else total, 2)
+
+        w = weights or DEFAULT_WEIGHTS
         total = (
             self.catalyst_quality    * w.get("catalyst_quality", 0) +
             self.sentiment_alignment * w.get("sentiment_alignment", 0) +
@@ -88,7 +136,7 @@ class ScoreBreakdown:
             self.competitive_moat    * w.get("competitive_moat", 0) +
             self.risk_reward         * w.get("risk_reward", 0)
         )
-        return round(min(max(total, 0), 100), 2)
+        return round(0 if total < 0 else 100 if total > 100 else total, 2)
 
     def to_dict(self) -> dict:
         return {
@@ -102,7 +150,30 @@ class ScoreBreakdown:
         }
 
 
-@dataclass
+def weighted_totals(sub_scores: "np.ndarray", weights: Optional[dict] = None) -> List[float]:
+    """
+    ScoreBreakdown.weighted_total for every row of an (n, 7) float64
+    matrix whose columns follow SCORE_COMPONENTS.
+
+    Columns are accumulated one at a time in the same order weighted_total
+    adds its terms (rather than via a BLAS matmul), so each composite is
+    bit-identical to the scalar path.  Each column is weighted in one
+    reused scratch buffer, so the pass allocates two length-n arrays
+    regardless of the number of components.
+    """
+    import numpy as np
+    w = weights or DEFAULT_WEIGHTS
+    total = np.empty(sub_scores.shape[0], dtype=np.float64)
+    term  = np.empty_like(total)
+    for j, name in enumerate(SCORE_COMPONENTS):
+        np.multiply(sub_scores[:, j], w.get(name, 0), out=total if j == 0 else term)
+        if j:
+            total += term
+    np.clip(total, 0, 100, out=total)
+    return [round(v, 2) for v in total.tolist()]
+
+
+@dataclass(slots=True)
 class OptionsRating:
     """
     Full options trade rating for a specific BiotechEvent.
@@ -135,19 +206,24 @@ class OptionsRating:
         self.composite_score = self.score_breakdown.weighted_total(weights)
         self.grade = score_to_grade(self.composite_score)
 
-    def to_dict(self) -> dict:
+    def to_dict(self, nested: bool = True) -> dict:
+        """
+        Plain-dict form.  nested=False leaves score_breakdown as the
+        ScoreBreakdown instance, for serializers (orjson) that write
+        dataclasses natively; its field order matches its to_dict.
+        """
         return {
             "event_id":            self.event_id,
             "ticker":              self.ticker,
             "rating_date":         self.rating_date.isoformat(),
-            "recommended_strategy":self.recommended_strategy.value,
+            "recommended_strategy":STRATEGY_VALUES[self.recommended_strategy],
             "composite_score":     self.composite_score,
-            "grade":               self.grade.value,
+            "grade":               GRADE_VALUES[self.grade],
             "confidence_pct":      self.confidence_pct,
             "target_expiry_days":  self.target_expiry_days,
             "suggested_delta":     self.suggested_delta,
             "max_risk_pct_port":   self.max_risk_pct_port,
-            "score_breakdown":     self.score_breakdown.to_dict(),
+            "score_breakdown":     self.score_breakdown.to_dict() if nested else self.score_breakdown,
             "analyst_flags":       self.analyst_flags,
             "notes":               self.notes,
         }
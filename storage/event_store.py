@@ -2,18 +2,38 @@
 JSON-backed persistence layer for BiotechEvents and OptionsRatings.
 Data is stored in data/events.json and data/ratings.json.
 """
+import copy
 import json
 import os
+import struct
+import sys
 import logging
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
 
 from models.event import (
     BiotechEvent, EventType, EventOutcome, SentimentTag, MarketContext
 )
 from models.rating import (
-    OptionsRating, OptionsStrategy, ScoreBreakdown, RatingGrade
+    OptionsRating, OptionsStrategy, ScoreBreakdown, RatingGrade,
+    GRADES, SCORE_COMPONENTS, grade_indices, weighted_totals,
 )
 
 logger = logging.getLogger(__name__)
@@ -23,8 +43,146 @@ EVENTS_FILE  = DATA_DIR / "events.json"
 RATINGS_FILE = DATA_DIR / "ratings.json"
 
 
+# Directories already created (or found) this process; saves a mkdir
+# syscall on every save
+_DIR_READY: Set[Path] = set()
+
+
 def _ensure_data_dir():
+    if DATA_DIR in _DIR_READY:
+        return
     DATA_DIR.mkdir(parents=True, exist_ok=True)
+    _DIR_READY.add(DATA_DIR)
+
+
+def _json_dumps(obj, pretty: bool = True) -> bytes:
+    """
+    JSON as UTF-8 bytes, indented or compact; orjson when installed,
+    else stdlib.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if pretty else orjson.dumps(obj)
+    if pretty:
+        return json.dumps(obj, indent=2).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _write_json_array(path: Path, records: Iterable[dict], pretty: bool = True) -> int:
+    """
+    Stream `records` to `path` as a JSON array, one record at a time
+    through a 1 MiB buffered writer, so the whole document is never held
+    in memory.  Output is byte-identical to _json_dumps(list(records), pretty).
+
+    The array is written to a sibling temp file and moved over `path` with
+    os.replace, so readers only ever see the old or the new file, never a
+    partial one.  Returns the number of records written.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    n = 0
+    try:
+        with open(tmp, "wb", buffering=1 << 20) as f:
+            if pretty:
+                for rec in records:
+                    f.write(b"[\n  " if n == 0 else b",\n  ")
+                    f.write(_json_dumps(rec).replace(b"\n", b"\n  "))
+                    n += 1
+                f.write(b"\n]" if n else b"[]")
+            else:
+                f.write(b"[")
+                for rec in records:
+                    if n:
+                        f.write(b",")
+                    f.write(_json_dumps(rec, pretty=False))
+                    n += 1
+                f.write(b"]")
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return n
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of `path`, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _json_loads(data: bytes):
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+# ---------------------------------------------------------------------------
+# Binary score sidecar
+# ---------------------------------------------------------------------------
+# Optional companion to ratings.json holding only what vectorised scoring
+# needs: a fixed header, then one packed record per rating of
+# (event_id, 7 x float64 in SCORE_COMPONENTS order).  The header carries the
+# (mtime_ns, size) of the ratings.json it was written with, so a sidecar left
+# behind by another writer is detected as stale and ignored.
+
+_SIDECAR_MAGIC  = b"BRS1"
+_SIDECAR_HEADER = struct.Struct("<4sqqII")   # magic, json mtime_ns, json size, n, id width
+
+
+def _sidecar_dtype(id_width: int) -> "np.dtype":
+    import numpy as np
+    return np.dtype([
+        ("event_id", f"S{id_width}"),
+        ("scores",   "<f8", (len(SCORE_COMPONENTS),)),
+    ])
+
+
+def _score_matrix(ratings: List[OptionsRating]) -> "np.ndarray":
+    """(N, 7) float64 matrix of rating breakdowns, columns in SCORE_COMPONENTS order."""
+    import numpy as np
+    n = len(ratings)
+    matrix = np.empty((n, len(SCORE_COMPONENTS)), dtype=np.float64)
+    for j, name in enumerate(SCORE_COMPONENTS):
+        matrix[:, j] = np.fromiter(
+            (getattr(r.score_breakdown, name) for r in ratings), dtype=np.float64, count=n
+        )
+    return matrix
+
+
+def _write_score_sidecar(
+    path: Path, ratings: List[OptionsRating], json_stamp: Tuple[int, int]
+) -> None:
+    import numpy as np
+    ids = [r.event_id.encode("utf-8") for r in ratings]
+    width = max(map(len, ids), default=1) or 1
+    records = np.empty(len(ratings), dtype=_sidecar_dtype(width))
+    records["event_id"] = ids
+    records["scores"] = _score_matrix(ratings)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_SIDECAR_HEADER.pack(_SIDECAR_MAGIC, *json_stamp, len(ids), width))
+            f.write(records.tobytes())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _read_score_sidecar(path: Path, json_stamp: Tuple[int, int]) -> Optional["np.ndarray"]:
+    """The sidecar's record array, or None if missing, stale or malformed."""
+    import numpy as np
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_SIDECAR_HEADER.size)
+            if len(header) != _SIDECAR_HEADER.size:
+                return None
+            magic, mtime_ns, size, n, width = _SIDECAR_HEADER.unpack(header)
+            if magic != _SIDECAR_MAGIC or (mtime_ns, size) != json_stamp or not width:
+                return None
+            records = np.fromfile(f, dtype=_sidecar_dtype(width), count=n)
+    except (OSError, ValueError):
+        return None
+    return records if len(records) == n else None
 
 
 # ---------------------------------------------------------------------------
@@ -48,7 +206,28 @@ def _event_to_dict(event: BiotechEvent) -> dict:
     return d
 
 
+# Enum value -> member maps: indexing these skips Enum.__call__ dispatch
+# for every field of every loaded record
+_EVENT_TYPE_MAP = EventType._value2member_map_
+_SENTIMENT_MAP  = SentimentTag._value2member_map_
+_OUTCOME_MAP    = EventOutcome._value2member_map_
+_STRAT_MAP      = OptionsStrategy._value2member_map_
+
+
+def _intern(s: Optional[str]) -> Optional[str]:
+    return sys.intern(s) if s else s
+
+
+# Event dates cluster and rating dates mostly equal the scoring day, so a
+# small cache turns most per-record parses into a dict hit (dates are
+# immutable, so sharing one object per value is safe)
+_parse_date = lru_cache(maxsize=1024)(date.fromisoformat)
+
+
 def _dict_to_event(d: dict) -> BiotechEvent:
+    # Tickers, company names, stages and indications repeat across many
+    # events; interning them once at load shares one string object per value
+    # and lets downstream ==/dict lookups short-circuit on identity.
     mc_data = d.get("market_context")
     market_ctx = None
     if mc_data:
@@ -62,19 +241,19 @@ def _dict_to_event(d: dict) -> BiotechEvent:
 
     return BiotechEvent(
         event_id         = d.get("event_id"),
-        ticker           = d["ticker"],
-        company_name     = d["company_name"],
-        event_type       = EventType(d["event_type"]),
-        event_date       = date.fromisoformat(d["event_date"]),
+        ticker           = _intern(d["ticker"]),
+        company_name     = _intern(d["company_name"]),
+        event_type       = _EVENT_TYPE_MAP[d["event_type"]],
+        event_date       = _parse_date(d["event_date"]),
         description      = d["description"],
-        sentiment        = SentimentTag(d.get("sentiment", "neutral")),
+        sentiment        = _SENTIMENT_MAP[d.get("sentiment", "neutral")],
         analyst_notes    = d.get("analyst_notes", ""),
-        pipeline_stage   = d.get("pipeline_stage"),
-        indication       = d.get("indication"),
+        pipeline_stage   = _intern(d.get("pipeline_stage")),
+        indication       = _intern(d.get("indication")),
         primary_endpoint = d.get("primary_endpoint"),
         competing_drugs  = d.get("competing_drugs", []),
         market_context   = market_ctx,
-        outcome          = EventOutcome(d.get("outcome", "pending")),
+        outcome          = _OUTCOME_MAP[d.get("outcome", "pending")],
         actual_move_pct  = d.get("actual_move_pct"),
         spy_move_pct     = d.get("spy_move_pct"),
         xbi_move_pct     = d.get("xbi_move_pct"),
@@ -84,8 +263,61 @@ def _dict_to_event(d: dict) -> BiotechEvent:
     )
 
 
-def _rating_to_dict(rating: OptionsRating) -> dict:
-    return rating.to_dict()
+def _intern_event_strings(event: BiotechEvent) -> None:
+    """Apply the _dict_to_event interning to an event decoded by msgspec."""
+    event.ticker         = _intern(event.ticker)
+    event.company_name   = _intern(event.company_name)
+    event.pipeline_stage = _intern(event.pipeline_stage)
+    event.indication     = _intern(event.indication)
+
+
+# msgspec decodes the events file straight into BiotechEvent/MarketContext
+# dataclasses (enums, dates and nested context included) in C, skipping the
+# intermediate dicts and the per-field _dict_to_event conversion.
+_EVENTS_DECODER = msgspec.json.Decoder(List[BiotechEvent]) if MSGSPEC_AVAILABLE else None
+
+
+def _decode_events(data: bytes) -> List[BiotechEvent]:
+    """
+    Events from the raw file bytes.  The typed decoder is stricter than
+    _dict_to_event (it rejects e.g. "tags": null), so a file it refuses is
+    re-read through the dict path rather than reported as unreadable.
+    """
+    if _EVENTS_DECODER is not None:
+        try:
+            events = _EVENTS_DECODER.decode(data)
+        except msgspec.ValidationError:
+            pass
+        else:
+            for e in events:
+                _intern_event_strings(e)
+            return events
+    return [_dict_to_event(d) for d in _json_loads(data)]
+
+
+# Same for ratings: OptionsRating/ScoreBreakdown are built by msgspec's
+# compiled decoder (it runs __post_init__, so composite and grade are
+# re-derived exactly as in _dict_to_rating).
+_RATINGS_DECODER = msgspec.json.Decoder(List[OptionsRating]) if MSGSPEC_AVAILABLE else None
+
+
+def _decode_ratings(data: bytes) -> List[OptionsRating]:
+    """
+    Ratings from the raw file bytes, falling back to _dict_to_rating when
+    the typed decoder rejects something it accepts (e.g. "notes": null or
+    a float target_expiry_days), as _decode_events does.
+    """
+    if _RATINGS_DECODER is not None:
+        try:
+            return _RATINGS_DECODER.decode(data)
+        except msgspec.ValidationError:
+            pass
+    return [_dict_to_rating(d) for d in _json_loads(data)]
+
+
+def _rating_to_json(rating: OptionsRating) -> dict:
+    # orjson serializes the ScoreBreakdown dataclass itself, so skip its dict
+    return rating.to_dict(nested=not ORJSON_AVAILABLE)
 
 
 def _dict_to_rating(d: dict) -> OptionsRating:
@@ -102,8 +334,8 @@ def _dict_to_rating(d: dict) -> OptionsRating:
     return OptionsRating(
         event_id              = d["event_id"],
         ticker                = d["ticker"],
-        rating_date           = date.fromisoformat(d["rating_date"]),
-        recommended_strategy  = OptionsStrategy(d["recommended_strategy"]),
+        rating_date           = _parse_date(d["rating_date"]),
+        recommended_strategy  = _STRAT_MAP[d["recommended_strategy"]],
         score_breakdown       = breakdown,
         confidence_pct        = d.get("confidence_pct", 0.0),
         target_expiry_days    = d.get("target_expiry_days"),
@@ -122,45 +354,152 @@ class EventStore:
     """
     Persistent store for BiotechEvents and OptionsRatings backed by JSON files.
 
+    Upserts and deletes go through an in-memory index keyed by event_id,
+    loaded from disk once.  With autoflush (the default) each mutation is
+    written straight back; with autoflush=False mutations only mark the
+    index dirty and are written by flush(), so N upserts cost one dump.
+    With score_sidecar=True each ratings save also writes ratings.bin, a
+    packed binary copy of the score breakdowns for load_score_matrix.
+
+    Loaded objects are cached and shared: load_events()/load_ratings()
+    return a new list each call, but the BiotechEvent/OptionsRating objects
+    in it are the store's own (the same ones get_event and the index hand
+    out).  Mutating one is visible to later loads in this process before it
+    is saved; copy an object first if it should stay private.
+
     Usage:
         store = EventStore()
         store.save_event(event)
         events = store.load_events()
         store.save_rating(rating)
         ratings = store.load_ratings()
+
+        bulk = EventStore(autoflush=False)
+        for e in events:
+            bulk.save_event(e)
+        bulk.flush()
     """
 
     def __init__(
         self,
         events_path: Optional[Path] = None,
         ratings_path: Optional[Path] = None,
+        autoflush: bool = True,
+        score_sidecar: bool = False,
     ):
         self.events_path  = events_path  or EVENTS_FILE
         self.ratings_path = ratings_path or RATINGS_FILE
+        self.autoflush    = autoflush
+        # Optional binary copy of the breakdowns next to ratings.json,
+        # read by load_score_matrix (see _write_score_sidecar)
+        self.scores_path: Optional[Path] = (
+            self.ratings_path.with_suffix(".bin") if score_sidecar else None
+        )
+        self._events_index:  Optional[Dict[str, BiotechEvent]]  = None
+        self._ratings_index: Optional[Dict[str, OptionsRating]] = None
+        self._events_dirty  = False
+        self._ratings_dirty = False
+        # Last parse of each file and the (mtime_ns, size) it was read at
+        self._events_cache:  Optional[List[BiotechEvent]]  = None
+        self._ratings_cache: Optional[List[OptionsRating]] = None
+        self._events_mtime:  Optional[Tuple[int, int]] = None
+        self._ratings_mtime: Optional[Tuple[int, int]] = None
         _ensure_data_dir()
 
+    def flush(self) -> None:
+        """Write any unflushed event / rating mutations to disk."""
+        if self._events_dirty:
+            self.save_events(list(self._events_index.values()))
+        if self._ratings_dirty:
+            self.save_ratings(list(self._ratings_index.values()))
+
+    def _sync_events(self) -> None:
+        """
+        Re-parse the events file into the cache if its (mtime, size) stamp
+        changed since the last parse, dropping any stale index.  A no-op
+        while there are unflushed changes.  Parse errors propagate.
+        """
+        if self._events_dirty:
+            return
+        stamp = _file_stamp(self.events_path)
+        if self._events_cache is not None and stamp == self._events_mtime:
+            return
+        if stamp is None:
+            events = []
+        else:
+            events = _decode_events(self.events_path.read_bytes())
+            logger.info("Loaded %d events from %s", len(events), self.events_path)
+        self._events_cache, self._events_mtime = events, stamp
+        self._events_index = None
+
+    def _sync_ratings(self) -> None:
+        """Same as _sync_events, for the ratings file."""
+        if self._ratings_dirty:
+            return
+        stamp = _file_stamp(self.ratings_path)
+        if self._ratings_cache is not None and stamp == self._ratings_mtime:
+            return
+        if stamp is None:
+            ratings = []
+        else:
+            ratings = _decode_ratings(self.ratings_path.read_bytes())
+            logger.info("Loaded %d ratings from %s", len(ratings), self.ratings_path)
+        self._ratings_cache, self._ratings_mtime = ratings, stamp
+        self._ratings_index = None
+
+    def _load_events_index(self) -> Dict[str, BiotechEvent]:
+        # One stat per call, no list copies.  A failed parse raises here
+        # rather than yielding an empty index a later flush would write out.
+        self._sync_events()
+        if self._events_index is None:
+            self._events_index = {e.event_id: e for e in self._events_cache}
+        return self._events_index
+
+    def _load_ratings_index(self) -> Dict[str, OptionsRating]:
+        self._sync_ratings()
+        if self._ratings_index is None:
+            self._ratings_index = {r.event_id: r for r in self._ratings_cache}
+        return self._ratings_index
+
+    def _events_changed(self) -> None:
+        self._events_dirty = True
+        if self.autoflush:
+            self.flush()
+
+    def _ratings_changed(self) -> None:
+        self._ratings_dirty = True
+        if self.autoflush:
+            self.flush()
+
     # --- Events ---
 
     def load_events(self) -> List[BiotechEvent]:
-        """Load all events from JSON file."""
-        if not self.events_path.exists():
-            return []
+        """
+        Load all events from JSON file (plus any unflushed changes).
+        The parse is cached and reused until the file's mtime or size
+        changes; the returned list is a fresh copy, the events are shared
+        (see the EventStore docstring).
+        """
+        if self._events_dirty:
+            return list(self._events_index.values())
         try:
-            with open(self.events_path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-            events = [_dict_to_event(d) for d in raw]
-            logger.info("Loaded %d events from %s", len(events), self.events_path)
-            return events
+            self._sync_events()
         except Exception as exc:
             logger.error("Failed to load events: %s", exc)
             return []
+        return list(self._events_cache)
 
     def save_events(self, events: List[BiotechEvent]) -> None:
         """Overwrite the events file with the given list."""
         _ensure_data_dir()
         try:
-            with open(self.events_path, "w", encoding="utf-8") as f:
-                json.dump([_event_to_dict(e) for e in events], f, indent=2)
+            _write_json_array(
+                self.events_path, (_event_to_dict(e) for e in events), pretty=False
+            )
+            self._events_index = {e.event_id: e for e in events}
+            self._events_dirty = False
+            self._events_cache = list(events)
+            self._events_mtime = _file_stamp(self.events_path)
             logger.info("Saved %d events to %s", len(events), self.events_path)
         except Exception as exc:
             logger.error("Failed to save events: %s", exc)
@@ -170,56 +509,60 @@ class EventStore:
         """
         Upsert a single event (insert or update by event_id).
         """
-        events = self.load_events()
-        idx = next(
-            (i for i, e in enumerate(events) if e.event_id == event.event_id),
-            None
-        )
-        if idx is not None:
-            events[idx] = event
+        index = self._load_events_index()
+        if event.event_id in index:
             logger.info("Updated event %s", event.event_id)
         else:
-            events.append(event)
             logger.info("Inserted event %s", event.event_id)
-        self.save_events(events)
+        index[event.event_id] = event
+        self._events_changed()
 
     def get_event(self, event_id: str) -> Optional[BiotechEvent]:
-        """Retrieve a single event by ID."""
-        return next(
-            (e for e in self.load_events() if e.event_id == event_id), None
-        )
+        """Retrieve a single event by ID (dict lookup in the event index)."""
+        try:
+            index = self._load_events_index()
+        except Exception as exc:
+            logger.error("Failed to load events: %s", exc)
+            return None
+        return index.get(event_id)
 
     def delete_event(self, event_id: str) -> bool:
         """Delete an event by ID. Returns True if deleted."""
-        events = self.load_events()
-        new_events = [e for e in events if e.event_id != event_id]
-        if len(new_events) == len(events):
+        index = self._load_events_index()
+        if index.pop(event_id, None) is None:
             return False
-        self.save_events(new_events)
+        self._events_changed()
         return True
 
     # --- Ratings ---
 
     def load_ratings(self) -> List[OptionsRating]:
-        """Load all ratings from JSON file."""
-        if not self.ratings_path.exists():
-            return []
+        """
+        Load all ratings from JSON file (plus any unflushed changes),
+        cached by file mtime/size like load_events.
+        """
+        if self._ratings_dirty:
+            return list(self._ratings_index.values())
         try:
-            with open(self.ratings_path, "r", encoding="utf-8") as f:
-                raw = json.load(f)
-            ratings = [_dict_to_rating(d) for d in raw]
-            logger.info("Loaded %d ratings from %s", len(ratings), self.ratings_path)
-            return ratings
+            self._sync_ratings()
         except Exception as exc:
             logger.error("Failed to load ratings: %s", exc)
             return []
+        return list(self._ratings_cache)
 
     def save_ratings(self, ratings: List[OptionsRating]) -> None:
         """Overwrite the ratings file."""
         _ensure_data_dir()
         try:
-            with open(self.ratings_path, "w", encoding="utf-8") as f:
-                json.dump([_rating_to_dict(r) for r in ratings], f, indent=2)
+            _write_json_array(
+                self.ratings_path, (_rating_to_json(r) for r in ratings), pretty=False
+            )
+            self._ratings_index = {r.event_id: r for r in ratings}
+            self._ratings_dirty = False
+            self._ratings_cache = list(ratings)
+            self._ratings_mtime = _file_stamp(self.ratings_path)
+            if self.scores_path is not None:
+                _write_score_sidecar(self.scores_path, ratings, self._ratings_mtime)
             logger.info("Saved %d ratings to %s", len(ratings), self.ratings_path)
         except Exception as exc:
             logger.error("Failed to save ratings: %s", exc)
@@ -227,38 +570,100 @@ class EventStore:
 
     def save_rating(self, rating: OptionsRating) -> None:
         """Upsert a single rating (by event_id)."""
+        self._load_ratings_index()[rating.event_id] = rating
+        self._ratings_changed()
+
+    def recompute_all_scores(self, weights: Optional[dict] = None) -> List[OptionsRating]:
+        """
+        Every stored rating re-scored under `weights` (default weights if
+        None), as copies with composite_score and grade replaced.
+
+        The result is in-memory only: the stored ratings are left untouched
+        and nothing is written, because loading a rating always re-derives
+        composite_score and grade from its breakdown with default weights,
+        so a custom-weighted score could not survive a reload anyway.
+
+        Breakdowns are stacked into one (N, 7) float64 array so the
+        composites and grades are computed column-wise for the whole store.
+        """
         ratings = self.load_ratings()
-        idx = next(
-            (i for i, r in enumerate(ratings) if r.event_id == rating.event_id),
-            None
-        )
-        if idx is not None:
-            ratings[idx] = rating
-        else:
-            ratings.append(rating)
-        self.save_ratings(ratings)
+        if not ratings:
+            return ratings
+
+        scores = weighted_totals(_score_matrix(ratings), weights)
+        grade_idx = grade_indices(scores)
+
+        rescored = []
+        for r, score, gi in zip(ratings, scores, grade_idx):
+            r = copy.copy(r)
+            r.composite_score = score
+            r.grade = GRADES[gi]
+            rescored.append(r)
+        logger.info("Recomputed scores for %d ratings", len(rescored))
+        return rescored
+
+    def load_score_matrix(self) -> Tuple[List[str], "np.ndarray"]:
+        """
+        (event_ids, (N, 7) float64 breakdown matrix) for every stored
+        rating, columns in SCORE_COMPONENTS order, ready for
+        weighted_totals.  With score_sidecar enabled and the sidecar in step
+        with ratings.json this is one read of the binary file, with no JSON
+        parse; otherwise it is built from load_ratings().
+        """
+        if self.scores_path is not None and not self._ratings_dirty:
+            stamp = _file_stamp(self.ratings_path)
+            records = _read_score_sidecar(self.scores_path, stamp) if stamp else None
+            if records is not None:
+                ids = [b.decode("utf-8") for b in records["event_id"].tolist()]
+                return ids, records["scores"]
+        ratings = self.load_ratings()
+        return [r.event_id for r in ratings], _score_matrix(ratings)
 
     def ratings_by_event(self) -> Dict[str, OptionsRating]:
         """Return a dict mapping event_id -> OptionsRating."""
         return {r.event_id: r for r in self.load_ratings()}
 
+    def _iter_export_records(self, include_ratings: bool, nested: bool = True) -> Iterator[dict]:
+        events  = self.load_events()
+        ratings = self.ratings_by_event() if include_ratings else {}
+        for event in events:
+            rec = _event_to_dict(event)
+            rating = ratings.get(event.event_id or "")
+            rec["rating"] = rating.to_dict(nested) if rating else None
+            yield rec
+
     def export_json(
         self,
         output_path: Path,
         include_ratings: bool = True,
+        pretty: bool = True,
     ) -> None:
         """
         Export a combined JSON with all events + ratings for external use
-        (e.g., feeding a dashboard or LLM analysis).
+        (e.g., feeding a dashboard or LLM analysis).  Indented for reading
+        unless pretty=False.
+        Records are streamed to disk one at a time; uses orjson when
+        installed, falling back to the stdlib encoder.
         """
-        events  = self.load_events()
-        ratings = self.ratings_by_event() if include_ratings else {}
-        export  = []
-        for event in events:
-            rec = _event_to_dict(event)
-            rating = ratings.get(event.event_id or "")
-            rec["rating"] = _rating_to_dict(rating) if rating else None
-            export.append(rec)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(export, f, indent=2)
+        records = self._iter_export_records(include_ratings, nested=not ORJSON_AVAILABLE)
+        n = _write_json_array(Path(output_path), records, pretty)
+        logger.info("Exported %d records to %s", n, output_path)
+
+    def export_msgpack(
+        self,
+        output_path: Path,
+        include_ratings: bool = True,
+    ) -> None:
+        """
+        Same records as export_json, encoded as MessagePack (smaller and
+        faster to produce/consume for large stores).  Requires msgspec.
+        """
+        if not MSGSPEC_AVAILABLE:
+            raise ImportError(
+                "msgspec is required for MessagePack export. Install it: pip install msgspec"
+            )
+        # msgspec encodes the ScoreBreakdown dataclass directly
+        export = list(self._iter_export_records(include_ratings, nested=False))
+        with open(output_path, "wb") as f:
+            f.write(msgspec.msgpack.encode(export))
         logger.info("Exported %d records to %s", len(export), output_path)